@@ -7,10 +7,16 @@ hits usage/token limits. This helps avoid purchasing extra credits by automatica
 using alternative providers when Claude's monthly limit is reached.
 """
 
+import asyncio
+import bisect
+import functools
 import os
+import re
 import sys
+import base64
+import itertools
 import logging
-import uuid
+import secrets
 import time
 import hashlib
 from typing import Optional, Dict, Any, List
@@ -35,6 +41,106 @@ if not logger.handlers:
     logger.setLevel(logging.INFO)
 
 
+# Error message fragments that mean Claude's usage/token limit was hit.
+# Compiled into one case-insensitive alternation so detection is a single
+# regex scan instead of a Python loop of substring checks.
+USAGE_LIMIT_INDICATORS = (
+    "quota exceeded",
+    "usage limit",
+    "token limit",
+    "monthly limit",
+    "billing limit",
+    "insufficient credits",
+    "payment required",
+    "purchase extra",
+    "extra usage credits",
+    "cm-1801",
+    "error code: 1801",
+)
+_USAGE_LIMIT_PATTERN = re.compile(
+    "|".join(re.escape(indicator) for indicator in USAGE_LIMIT_INDICATORS),
+    re.IGNORECASE,
+)
+
+
+def _error_text(error: BaseException) -> str:
+    """
+    Lowercased message of an error, computed once per exception object.
+
+    The same exception is checked for usage limits and classified several
+    times along the retry/fallback chain; the normalized text is stored on
+    the exception so str() + lower() only run once.
+    """
+    try:
+        return error._engram_error_text
+    except AttributeError:
+        pass
+    text = str(error).lower()
+    try:
+        error._engram_error_text = text
+    except (AttributeError, TypeError):
+        pass  # Exception types that refuse new attributes just aren't cached
+    return text
+
+
+# Clock used for latency measurement (tests swap in a fake clock)
+_now_ns = time.monotonic_ns
+
+
+def _elapsed_seconds(start_ns: int) -> float:
+    """Seconds since a _now_ns() reading (never negative)."""
+    return (_now_ns() - start_ns) / 1e9
+
+
+# Provider health: outcomes are kept in a fixed-size sliding window (must be a
+# power of two) so flapping providers trip the breaker even without 3
+# consecutive failures.
+HEALTH_WINDOW = 64
+HEALTH_WINDOW_FAILURE_RATE = 0.5
+_HEALTH_WINDOW_MAX_FAILURES = int(HEALTH_WINDOW * HEALTH_WINDOW_FAILURE_RATE)
+# Consecutive failures that open a provider's circuit
+CIRCUIT_FAILURE_THRESHOLD = 3
+
+
+@functools.lru_cache(maxsize=16)
+def _env_config(
+    fallback_providers: Optional[str],
+    max_tokens: Optional[str],
+    max_cost: Optional[str],
+    timeout: Optional[str],
+) -> Dict[str, Any]:
+    """Parse the CHAINMIND_* environment overrides.
+
+    Cached on the raw values, so helpers created under the same environment
+    skip re-parsing while a changed environment (e.g. patch.dict in tests)
+    is still picked up. Provider names are interned and returned as a tuple
+    so the cached value can't be mutated by callers.
+    """
+    config: Dict[str, Any] = {}
+    if fallback_providers:
+        config["fallback_providers"] = tuple(sys.intern(p) for p in fallback_providers.split(","))
+    if max_tokens:
+        config["max_tokens_per_request"] = int(max_tokens)
+    if max_cost:
+        config["max_cost_per_request"] = float(max_cost)
+    if timeout:
+        config["request_timeout_seconds"] = float(timeout)
+    return config
+
+
+# Correlation IDs only need to be unique enough to follow one request through
+# the logs. A counter with a random per-process start avoids the os.urandom
+# syscall and hex formatting of uuid4() on every request; next() on
+# itertools.count is atomic under the GIL.
+_correlation_counter = itertools.count(int.from_bytes(secrets.token_bytes(5), "big"))
+
+
+def _new_correlation_id() -> str:
+    """Return an 8-character request correlation ID."""
+    value = next(_correlation_counter) & 0xFF_FFFF_FFFF  # 40 bits = 8 base32 chars
+    return base64.b32encode(value.to_bytes(5, "big")).decode().lower()
+
+
 class ChainMindHelper:
     """
     Helper class for Claude to use ChainMind's cost optimization and usage limit handling.
@@ -72,6 +178,11 @@ class ChainMindHelper:
         self._cache_size = cache_size
         self._response_cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
 
+        # Requests currently being generated, by cache key (single-flight),
+        # and how many callers are awaiting each shared task
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._inflight_waiters: Dict[asyncio.Task, int] = {}
+
         # Provider health tracking
         self._provider_health: Dict[str, Dict[str, Any]] = {}
 
@@ -208,6 +319,84 @@ class ChainMindHelper:
             - usage_limit_hit: Whether Claude usage limit was hit
             - model_selection: Information about model selection (if auto_select_model=True)
         """
+        # Coalesce concurrent identical requests (single-flight): the first
+        # caller starts the work as a task and every caller, first included,
+        # awaits it through asyncio.shield. Cancelling one caller therefore
+        # never cancels the request for the others.
+        uses_claude_key = bool(prefer_claude) and not (
+            auto_select_model or (prefer_claude is None and self._auto_select_enabled)
+        )
+        flight_key = self._generate_cache_key(prompt, uses_claude_key, kwargs)
+        task = self._inflight.get(flight_key)
+        joined = task is not None
+        if not joined:
+            task = asyncio.ensure_future(self._generate(
+                prompt,
+                prefer_claude=prefer_claude,
+                auto_select_model=auto_select_model,
+                fallback_providers=fallback_providers,
+                agent_role=agent_role,
+                agent_id=agent_id,
+                **kwargs
+            ))
+            self._inflight[flight_key] = task
+            task.add_done_callback(functools.partial(self._finish_inflight, flight_key))
+
+        self._inflight_waiters[task] = self._inflight_waiters.get(task, 0) + 1
+        try:
+            if joined:
+                return await self._join_inflight(task)
+            return await asyncio.shield(task)
+        finally:
+            self._inflight_waiters[task] -= 1
+            if not self._inflight_waiters[task]:
+                del self._inflight_waiters[task]
+                if not task.done():
+                    # Every caller gave up - stop the shared request
+                    task.cancel()
+                    if self._inflight.get(flight_key) is task:
+                        del self._inflight[flight_key]
+
+    def _finish_inflight(self, flight_key: str, task: "asyncio.Task") -> None:
+        """Forget a finished single-flight task so later requests start fresh."""
+        if self._inflight.get(flight_key) is task:
+            del self._inflight[flight_key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved when every caller was cancelled
+
+    async def _join_inflight(self, inflight: "asyncio.Task") -> Dict[str, Any]:
+        """Wait for an identical in-flight request and reuse its response."""
+        correlation_id = _new_correlation_id()
+        self._metrics["total_requests"] += 1
+
+        try:
+            shared = await asyncio.shield(inflight)
+        except Exception:
+            self._metrics["failed_requests"] += 1
+            raise
+
+        # Only a successful shared response counts as a hit
+        self._metrics["cache_hits"] += 1
+        logger.info(f"[{correlation_id}] Joined in-flight request", extra={
+            "correlation_id": correlation_id
+        })
+
+        result = shared.copy()
+        result["correlation_id"] = correlation_id
+        result["from_cache"] = True
+        return result
+
+    async def _generate(
+        self,
+        prompt: str,
+        prefer_claude: Optional[bool] = True,
+        auto_select_model: bool = False,
+        fallback_providers: Optional[List[str]] = None,
+        agent_role: Optional[str] = None,
+        agent_id: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Dispatch a single (non-coalesced) generate() request."""
         # IMPORTANT: Claude Code already uses Claude API by default
         # ChainMind is ONLY called when Claude Code's Claude API hits token limits
         # Therefore: Skip Claude, use smart routing to select best fallback (OpenAI)
@@ -222,8 +411,8 @@ class ChainMindHelper:
             return await self._generate_with_fallback_skip_claude(prompt, fallback_providers, agent_role=agent_role, agent_id=agent_id, **kwargs)
 
         # Generate correlation ID for request tracking
-        correlation_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+        correlation_id = _new_correlation_id()
+        start_ns = _now_ns()
         self._metrics["total_requests"] += 1
 
         logger.info(f"[{correlation_id}] Starting generation request", extra={
@@ -288,7 +477,7 @@ class ChainMindHelper:
                     logger.warning(f"[{correlation_id}] Empty response received from Claude")
                     raise ValueError("Empty response received from provider")
 
-                latency = time.time() - start_time
+                latency = _elapsed_seconds(start_ns)
                 self._metrics["successful_requests"] += 1
                 self._metrics["total_latency"] += latency
                 self._metrics["provider_usage"]["anthropic"] = self._metrics["provider_usage"].get("anthropic", 0) + 1
@@ -383,82 +572,83 @@ class ChainMindHelper:
 
                         # Execute all fallback attempts in parallel
                         fallback_tasks = [
-                            try_fallback_provider(provider)
+                            asyncio.create_task(try_fallback_provider(provider))
                             for provider in capable_providers
                         ]
 
-                        fallback_results = await asyncio.gather(*fallback_tasks, return_exceptions=True)
-
-                        # Process results - return first successful
-                        for result in fallback_results:
-                            if isinstance(result, Exception):
-                                continue
-
-                            result_data, provider, error_info = result
-
-                            if error_info:
-                                # Failed attempt
-                                fallback_errors.append({
-                                    "provider": provider,
-                                    **error_info
-                                })
-                                logger.warning(f"[{correlation_id}] Fallback provider {provider} failed", extra={
-                                    "correlation_id": correlation_id,
-                                    "provider": provider,
-                                    "error_type": error_info["error_type"],
-                                    "error_category": error_info["error_category"]
-                                })
-                            elif result_data:
-                                # Success!
-                                response_text = self._extract_response(result_data)
-                                if not response_text or not response_text.strip():
-                                    logger.warning(f"[{correlation_id}] Empty response from {provider}")
+                        # Take results in priority order and return the first
+                        # success without waiting on lower-priority providers
+                        try:
+                            for task in fallback_tasks:
+                                result_data, provider, error_info = await task
+
+                                if error_info:
+                                    # Failed attempt
                                     fallback_errors.append({
                                         "provider": provider,
-                                        "error_type": "ValueError",
-                                        "error_message": "Empty response from provider",
-                                        "error_category": "validation"
+                                        **error_info
+                                    })
+                                    logger.warning(f"[{correlation_id}] Fallback provider {provider} failed", extra={
+                                        "correlation_id": correlation_id,
+                                        "provider": provider,
+                                        "error_type": error_info["error_type"],
+                                        "error_category": error_info["error_category"]
+                                    })
+                                elif result_data:
+                                    # Success!
+                                    response_text = self._extract_response(result_data)
+                                    if not response_text or not response_text.strip():
+                                        logger.warning(f"[{correlation_id}] Empty response from {provider}")
+                                        fallback_errors.append({
+                                            "provider": provider,
+                                            "error_type": "ValueError",
+                                            "error_message": "Empty response from provider",
+                                            "error_category": "validation"
+                                        })
+                                        continue
+
+                                    latency = _elapsed_seconds(start_ns)
+                                    self._metrics["successful_requests"] += 1
+                                    self._metrics["fallback_requests"] += 1
+                                    self._metrics["total_latency"] += latency
+                                    self._metrics["provider_usage"][provider] = self._metrics["provider_usage"].get(provider, 0) + 1
+
+                                    logger.info(f"[{correlation_id}] Fallback successful (parallel)", extra={
+                                        "correlation_id": correlation_id,
+                                        "provider": provider,
+                                        "response_length": len(response_text),
+                                        "latency_seconds": round(latency, 3)
                                     })
-                                    continue
-
-                                latency = time.time() - start_time
-                                self._metrics["successful_requests"] += 1
-                                self._metrics["fallback_requests"] += 1
-                                self._metrics["total_latency"] += latency
-                                self._metrics["provider_usage"][provider] = self._metrics["provider_usage"].get(provider, 0) + 1
-
-                                logger.info(f"[{correlation_id}] Fallback successful (parallel)", extra={
-                                    "correlation_id": correlation_id,
-                                    "provider": provider,
-                                    "response_length": len(response_text),
-                                    "latency_seconds": round(latency, 3)
-                                })
-
-                                # Success with fallback
-                                response = {
-                                    "response": response_text,
-                                    "provider": provider,
-                                    "fallback_used": True,
-                                    "usage_limit_hit": True,
-                                    "fallback_reason": "Claude usage limit exceeded",
-                                    "metadata": self._extract_metadata(result_data),
-                                    "correlation_id": correlation_id,
-                                    "latency_seconds": latency,
-                                    "original_error": {
-                                        "type": type(e).__name__,
-                                        "message": str(e),
-                                        "category": error_category
-                                    },
-                                    "from_cache": False
-                                }
-
-                                # Cache the result
-                                self._cache_result(cache_key, response)
 
-                                return response
+                                    # Success with fallback
+                                    response = {
+                                        "response": response_text,
+                                        "provider": provider,
+                                        "fallback_used": True,
+                                        "usage_limit_hit": True,
+                                        "fallback_reason": "Claude usage limit exceeded",
+                                        "metadata": self._extract_metadata(result_data),
+                                        "correlation_id": correlation_id,
+                                        "latency_seconds": latency,
+                                        "original_error": {
+                                            "type": type(e).__name__,
+                                            "message": str(e),
+                                            "category": error_category
+                                        },
+                                        "from_cache": False
+                                    }
+
+                                    # Cache the result
+                                    self._cache_result(cache_key, response)
+
+                                    return response
+                        finally:
+                            # Cancel attempts still running (no-op for finished ones)
+                            for task in fallback_tasks:
+                                task.cancel()
 
                     # All fallbacks failed - aggregate errors
-                    latency = time.time() - start_time
+                    latency = _elapsed_seconds(start_ns)
                     self._metrics["failed_requests"] += 1
                     error_type = type(e).__name__
                     self._metrics["error_counts"][error_type] = self._metrics["error_counts"].get(error_type, 0) + 1
@@ -502,7 +692,7 @@ class ChainMindHelper:
                 logger.warning(f"[{correlation_id}] Empty response from ChainMind routing")
                 raise ValueError("Empty response received from provider")
 
-            latency = time.time() - start_time
+            latency = _elapsed_seconds(start_ns)
             provider = self._extract_provider(result)
             self._metrics["successful_requests"] += 1
             self._metrics["total_latency"] += latency
@@ -553,8 +743,8 @@ class ChainMindHelper:
         Returns:
             Dict with response and model selection information
         """
-        correlation_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+        correlation_id = _new_correlation_id()
+        start_ns = _now_ns()
         self._metrics["total_requests"] += 1
 
         logger.info(f"[{correlation_id}] Starting smart routing request", extra={
@@ -644,7 +834,7 @@ class ChainMindHelper:
                 logger.warning(f"[{correlation_id}] Empty response from smart routing")
                 raise ValueError("Empty response received from provider")
 
-            latency = time.time() - start_time
+            latency = _elapsed_seconds(start_ns)
             provider = self._extract_provider(result)
             model = result.get("model") or result.get("model_info", {}).get("model_id", "unknown")
 
@@ -707,7 +897,7 @@ class ChainMindHelper:
                 prefer_claude=False,  # Don't prefer Claude in fallback
                 fallback_providers=fallback_providers,
                 correlation_id=correlation_id,
-                start_time=start_time,
+                start_ns=start_ns,
                 cache_key=cache_key,
                 **kwargs
             )
@@ -725,8 +915,8 @@ class ChainMindHelper:
         This method is called when Claude Code's Claude API hits token limits.
         Therefore: Skip Claude, go straight to OpenAI as primary fallback.
         """
-        correlation_id = str(uuid.uuid4())[:8]
-        start_time = time.time()
+        correlation_id = _new_correlation_id()
+        start_ns = _now_ns()
         self._metrics["total_requests"] += 1
 
         logger.info(f"[{correlation_id}] Starting fallback (Claude Code already tried Claude)", extra={
@@ -766,7 +956,7 @@ class ChainMindHelper:
 
                 response_text = self._extract_response(result)
                 if response_text and response_text.strip():
-                    latency = time.time() - start_time
+                    latency = _elapsed_seconds(start_ns)
                     self._metrics["successful_requests"] += 1
                     self._metrics["total_latency"] += latency
                     self._metrics["provider_usage"][provider] = self._metrics["provider_usage"].get(provider, 0) + 1
@@ -879,7 +1069,7 @@ class ChainMindHelper:
                 logger.debug(f"Error classifier failed: {classifier_error}")
 
         # Fallback to basic classification
-        error_str = str(error).lower()
+        error_str = _error_text(error)
         if "quota" in error_str or "usage limit" in error_str:
             return "quota_exceeded"
         elif "rate limit" in error_str:
@@ -896,6 +1086,50 @@ class ChainMindHelper:
             from backend.core.errors.standardized_provider_errors import ProviderErrorCategory
             return error_category == ProviderErrorCategory.QUOTA_EXCEEDED
 
+        decided = self._usage_limit_from_error_type(error)
+        if decided is not None:
+            return decided
+
+        # Fallback to string matching (single pass over the message)
+        return _USAGE_LIMIT_PATTERN.search(_error_text(error)) is not None
+
+    def classify_errors_batch(self, errors: List[BaseException]) -> List[bool]:
+        """
+        Check many errors for usage/token limits at once.
+
+        Gives the same answer as _is_usage_limit_error() for each error, but
+        errors that need message matching are joined and scanned with one
+        regex pass instead of one search per error.
+
+        Args:
+            errors: Exceptions to check
+
+        Returns:
+            List of booleans, one per error (True = usage limit hit)
+        """
+        results = [self._usage_limit_from_error_type(error) for error in errors]
+        pending = [i for i, decided in enumerate(results) if decided is None]
+
+        if pending:
+            messages = [_error_text(errors[i]) for i in pending]
+            # Offsets of each message in the joined text. No indicator
+            # contains a newline, so a match never spans two messages.
+            starts = list(itertools.accumulate((len(m) + 1 for m in messages[:-1]), initial=0))
+            hits = {
+                bisect.bisect_right(starts, match.start()) - 1
+                for match in _USAGE_LIMIT_PATTERN.finditer("\n".join(messages))
+            }
+            for position, index in enumerate(pending):
+                results[index] = position in hits
+
+        return results
+
+    def _usage_limit_from_error_type(self, error: BaseException) -> Optional[bool]:
+        """
+        Decide usage-limit status from the error's type, code and cause chain.
+
+        Returns None when only the error message can tell.
+        """
         # Check exception type hierarchy first
         try:
             from backend.core.errors.additional_errors import QuotaExceededError
@@ -934,27 +1168,7 @@ class ChainMindHelper:
             except Exception:
                 pass
 
-        # Fallback to string matching
-        error_str = str(error).lower()
-        usage_limit_indicators = [
-            "quota exceeded",
-            "usage limit",
-            "token limit",
-            "monthly limit",
-            "billing limit",
-            "insufficient credits",
-            "payment required",
-            "purchase extra",
-            "extra usage credits",
-            "cm-1801",
-            "error code: 1801",
-        ]
-
-        for indicator in usage_limit_indicators:
-            if indicator in error_str:
-                return True
-
-        return False
+        return None
 
     def _extract_response(self, result: Any) -> str:
         """Extract response text from ChainMind result with validation."""
@@ -1079,11 +1293,13 @@ class ChainMindHelper:
         if not self._initialized:
             self._init_chainmind()
 
-        available = self._router is not None
-        if not available and self._last_init_error:
-            logger.debug(f"ChainMind unavailable: {self._last_init_error}")
+        # Fast path: no extra work once the router is up
+        if self._router is not None:
+            return True
 
-        return available
+        if self._last_init_error:
+            logger.debug("ChainMind unavailable: %s", self._last_init_error)
+        return False
 
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -1133,37 +1349,75 @@ class ChainMindHelper:
         }
 
     def get_metrics(self) -> Dict[str, Any]:
-        """Get performance and usage metrics."""
-        total_requests = self._metrics["total_requests"]
-        avg_latency = (
-            self._metrics["total_latency"] / total_requests
-            if total_requests > 0 else 0.0
-        )
+        """Get performance and usage metrics.
+
+        Counters are plain ints/floats updated in place on the request path;
+        derived values (rates, averages) are only computed here.
+        """
+        metrics = self._metrics
+        total_requests = metrics["total_requests"]
+        total_latency = metrics["total_latency"]
+        avg_latency = total_latency / total_requests if total_requests > 0 else 0.0
         cache_hit_rate = (
-            self._metrics["cache_hits"] / total_requests * 100
+            metrics["cache_hits"] / total_requests * 100
             if total_requests > 0 else 0.0
         )
 
-        # Get connection pool metrics if available
-        pool_metrics = self._get_pool_metrics()
-
         return {
             "total_requests": total_requests,
-            "successful_requests": self._metrics["successful_requests"],
-            "failed_requests": self._metrics["failed_requests"],
-            "fallback_requests": self._metrics["fallback_requests"],
-            "cache_hits": self._metrics["cache_hits"],
-            "cache_misses": self._metrics["cache_misses"],
+            "successful_requests": metrics["successful_requests"],
+            "failed_requests": metrics["failed_requests"],
+            "fallback_requests": metrics["fallback_requests"],
+            "cache_hits": metrics["cache_hits"],
+            "cache_misses": metrics["cache_misses"],
             "cache_hit_rate_percent": round(cache_hit_rate, 2),
+            "total_latency": total_latency,
             "average_latency_seconds": round(avg_latency, 3),
-            "provider_usage": self._metrics["provider_usage"].copy(),
-            "error_counts": self._metrics["error_counts"].copy(),
+            "provider_usage": metrics["provider_usage"].copy(),
+            "error_counts": metrics["error_counts"].copy(),
+            "circuit_breaker_skips": metrics["circuit_breaker_skips"],
             "cache_size": len(self._response_cache),
             "cache_max_size": self._cache_size,
-            "batch_requests": self._metrics["batch_requests"],
-            "connection_pool": pool_metrics
+            "batch_requests": metrics["batch_requests"],
+            # Get connection pool metrics if available
+            "connection_pool": self._get_pool_metrics()
         }
 
+    def metrics_snapshot(self) -> Dict[str, Any]:
+        """
+        Copy the raw metric counters, for later use with metrics_delta().
+
+        Unlike get_metrics(), no derived values or pool metrics are computed.
+        """
+        snapshot = self._metrics.copy()
+        snapshot["provider_usage"] = snapshot["provider_usage"].copy()
+        snapshot["error_counts"] = snapshot["error_counts"].copy()
+        return snapshot
+
+    def metrics_delta(self, before: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Change in each metric counter since a metrics_snapshot().
+
+        Args:
+            before: Snapshot returned by metrics_snapshot()
+
+        Returns:
+            Dict with the same keys as the snapshot; provider_usage and
+            error_counts only list keys whose count changed
+        """
+        delta = {}
+        for name, value in self._metrics.items():
+            previous = before.get(name, {} if isinstance(value, dict) else 0)
+            if isinstance(value, dict):
+                delta[name] = {
+                    key: count - previous.get(key, 0)
+                    for key, count in value.items()
+                    if count != previous.get(key, 0)
+                }
+            else:
+                delta[name] = value - previous
+        return delta
+
     def _get_pool_metrics(self) -> Dict[str, Any]:
         """Get connection pool metrics from ChainMind if available."""
         pool_metrics = {
@@ -1198,16 +1452,16 @@ class ChainMindHelper:
 
     def _generate_cache_key(self, prompt: str, prefer_claude: bool, kwargs: Dict[str, Any]) -> str:
         """Generate cache key for request deduplication."""
-        # Include prompt, provider preference, and key parameters
-        key_parts = [
-            prompt,
-            str(prefer_claude),
-            str(kwargs.get("temperature", "")),
-            str(kwargs.get("max_tokens", "")),
-            str(kwargs.get("model", ""))
-        ]
-        key_string = "|".join(key_parts)
-        return hashlib.md5(key_string.encode()).hexdigest()
+        # Include prompt, provider preference, and key parameters.
+        # BLAKE2b (stdlib, 64-bit optimized) is fed incrementally so large
+        # prompts are hashed in place instead of being copied into a joined key.
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(prompt.encode())
+        key_hash.update(
+            f"|{prefer_claude}|{kwargs.get('temperature', '')}"
+            f"|{kwargs.get('max_tokens', '')}|{kwargs.get('model', '')}".encode()
+        )
+        return key_hash.hexdigest()
 
     def _cache_result(self, cache_key: str, result: Dict[str, Any]) -> None:
         """Cache a result with LRU eviction."""
@@ -1246,15 +1500,15 @@ class ChainMindHelper:
             logger.debug(f"Could not load ChainMind ConfigManager: {e}")
 
         # Load from environment variables (for engram-specific overrides)
-        import os
-        if os.environ.get("CHAINMIND_FALLBACK_PROVIDERS"):
-            config["fallback_providers"] = os.environ["CHAINMIND_FALLBACK_PROVIDERS"].split(",")
-        if os.environ.get("CHAINMIND_MAX_TOKENS"):
-            config["max_tokens_per_request"] = int(os.environ["CHAINMIND_MAX_TOKENS"])
-        if os.environ.get("CHAINMIND_MAX_COST"):
-            config["max_cost_per_request"] = float(os.environ["CHAINMIND_MAX_COST"])
-        if os.environ.get("CHAINMIND_TIMEOUT"):
-            config["request_timeout_seconds"] = float(os.environ["CHAINMIND_TIMEOUT"])
+        env_config = _env_config(
+            os.environ.get("CHAINMIND_FALLBACK_PROVIDERS"),
+            os.environ.get("CHAINMIND_MAX_TOKENS"),
+            os.environ.get("CHAINMIND_MAX_COST"),
+            os.environ.get("CHAINMIND_TIMEOUT"),
+        )
+        config.update(env_config)
+        if "fallback_providers" in env_config:
+            config["fallback_providers"] = list(env_config["fallback_providers"])
 
         # Load from engram-mcp config file (for engram-specific settings)
         # This takes precedence over ChainMind config for engram-specific settings
@@ -1287,30 +1541,41 @@ class ChainMindHelper:
                 logger.debug(f"Error checking circuit breaker for {provider}: {e}")
 
         # Check local health tracking
-        if provider in self._provider_health:
-            health = self._provider_health[provider]
+        health = self._provider_health.get(provider)
+        if health is not None:
             if health.get("circuit_open", False):
                 return False
             # Check if recent failures exceed threshold
-            recent_failures = health.get("recent_failures", 0)
-            if recent_failures >= 3:  # Threshold
+            if health.get("recent_failures", 0) >= CIRCUIT_FAILURE_THRESHOLD:
                 return False
 
         return True
 
     def _update_provider_health(self, provider: str, success: bool) -> None:
         """Update provider health tracking."""
-        if provider not in self._provider_health:
-            self._provider_health[provider] = {
+        health = self._provider_health.get(provider)
+        if health is None:
+            health = self._provider_health[provider] = {
                 "successes": 0,
                 "failures": 0,
                 "recent_failures": 0,
                 "circuit_open": False,
                 "last_success": None,
-                "last_failure": None
+                "last_failure": None,
+                # Ring buffer of the last HEALTH_WINDOW outcomes (1 = failure)
+                "window": bytearray(HEALTH_WINDOW),
+                "window_head": 0,
+                "window_failures": 0
             }
 
-        health = self._provider_health[provider]
+        # Slide the window: overwrite the oldest outcome, adjust the count in O(1)
+        window = health["window"]
+        head = health["window_head"]
+        outcome = 0 if success else 1
+        health["window_failures"] += outcome - window[head]
+        window[head] = outcome
+        health["window_head"] = (head + 1) & (HEALTH_WINDOW - 1)
+
         if success:
             health["successes"] += 1
             health["recent_failures"] = 0
@@ -1320,7 +1585,11 @@ class ChainMindHelper:
             health["failures"] += 1
             health["recent_failures"] += 1
             health["last_failure"] = time.time()
-            if health["recent_failures"] >= 3:
+            if not health["circuit_open"] and (
+                health["recent_failures"] >= CIRCUIT_FAILURE_THRESHOLD
+                or health["window_failures"] > _HEALTH_WINDOW_MAX_FAILURES
+            ):
+                # Only log the closed -> open transition, not every failure after it
                 health["circuit_open"] = True
                 logger.warning(f"Provider {provider} marked as unhealthy (circuit open)")
 
@@ -14,6 +14,7 @@ maintaining focus, learning from outcomes, and preventing repeated mistakes.
 
 import json
 import re
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Literal
@@ -22,6 +23,11 @@ from enum import Enum
 
 import networkx as nx
 
+try:
+    import orjson  # Optional: much faster (de)serialization of the graph file
+except ImportError:
+    orjson = None
+
 
 # =============================================================================
 # RELATIONSHIP TYPES
@@ -203,18 +209,31 @@ class KnowledgeGraph:
         self.data_dir = Path(data_dir)
         self.graph_path = self.data_dir / "knowledge_graph.json"
 
+        # Nesting depth of deferred_save() blocks, and whether a save was skipped
+        self._save_depth = 0
+        self._save_pending = False
+
         # Load or create graph
         self.graph = self._load_graph()
 
         # Clean up any garbage entities on load
         self._cleanup_garbage_entities()
 
+        # source_role -> memory node IDs, kept in sync by add/remove_memory
+        self._role_index: dict[Optional[str], set[str]] = {}
+        for node_id, data in self.graph.nodes(data=True):
+            if data.get("node_type") == "memory":
+                self._role_index.setdefault(data.get("source_role"), set()).add(node_id)
+
     def _load_graph(self) -> nx.DiGraph:
         """Load graph from disk or create new."""
         if self.graph_path.exists():
             try:
-                with open(self.graph_path) as f:
-                    data = json.load(f)
+                if orjson is not None:
+                    data = orjson.loads(self.graph_path.read_bytes())
+                else:
+                    with open(self.graph_path) as f:
+                        data = json.load(f)
                 return nx.node_link_graph(data, edges="links")
             except Exception:
                 pass
@@ -224,9 +243,39 @@ class KnowledgeGraph:
         """Persist graph to disk."""
         self.data_dir.mkdir(parents=True, exist_ok=True)
         data = nx.node_link_data(self.graph, edges="links")
+        if orjson is not None:
+            self.graph_path.write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+            return
         with open(self.graph_path, 'w') as f:
             json.dump(data, f, indent=2)
 
+    def _persist(self):
+        """Save now, or once at the end of the enclosing deferred_save() block."""
+        if self._save_depth:
+            self._save_pending = True
+        else:
+            self.save()
+
+    @contextmanager
+    def deferred_save(self):
+        """Batch several graph updates into a single save.
+
+        Usage:
+            with graph.deferred_save():
+                graph.add_entity(...)
+                graph.add_relationship(...)
+        """
+        self._save_depth += 1
+        try:
+            yield self
+        finally:
+            self._save_depth -= 1
+            if self._save_depth == 0 and self._save_pending:
+                self._save_pending = False
+                self.save()
+
     def _cleanup_garbage_entities(self):
         """Remove malformed entities (like regex patterns that leaked in)."""
         garbage = []
@@ -319,51 +368,91 @@ class KnowledgeGraph:
         - Entity nodes for each extracted entity
         - 'mentions' edges from memory to entities
         """
-        # Create memory node with rich attributes
-        node_attrs = MemoryNode(
-            id=memory_id,
-            memory_type=memory_type,
-            project=project,
-            source_role=source_role,
-            status=status,
-            confidence=confidence,
-            impact=impact,
-            validation_count=0,
-            trigger_context=trigger_context,
-            domains=domains or [],
-        )
-
-        self.graph.add_node(memory_id, node_type="memory", **node_attrs.to_dict())
-
-        # Extract and link entities
-        entities = self.extract_entities(content)
-
-        # Also add project as entity if specified
-        if project:
-            entities.append((EntityType.PROJECT, project))
+        return self.add_memories([{
+            "memory_id": memory_id,
+            "content": content,
+            "memory_type": memory_type,
+            "project": project,
+            "source_role": source_role,
+            "status": status,
+            "confidence": confidence,
+            "impact": impact,
+            "trigger_context": trigger_context,
+            "domains": domains,
+        }])[0]
+
+    def add_memories(self, memories: list[dict]) -> list[list[tuple[EntityType, str]]]:
+        """
+        Add several memories to the graph with one bulk update and one save.
 
-        for entity_type, entity_name in entities:
-            entity_id = self._make_entity_id(entity_type, entity_name)
+        Each dict takes add_memory() keyword arguments (memory_id, content
+        and memory_type required). Returns the extracted entities per memory,
+        in input order.
+        """
+        memory_nodes = []
+        entity_nodes = {}
+        edges = []
+        extracted = []
+
+        for mem in memories:
+            memory_id = mem["memory_id"]
+            project = mem.get("project")
+            source_role = mem.get("source_role")
+
+            # Create memory node with rich attributes
+            node_attrs = MemoryNode(
+                id=memory_id,
+                memory_type=mem["memory_type"],
+                project=project,
+                source_role=source_role,
+                status=mem.get("status", "active"),
+                confidence=mem.get("confidence", 0.5),
+                impact=mem.get("impact", "medium"),
+                validation_count=0,
+                trigger_context=mem.get("trigger_context"),
+                domains=mem.get("domains") or [],
+            )
 
-            # Add entity node if not exists
-            if not self.graph.has_node(entity_id):
-                entity_attrs = EntityNode(
-                    id=entity_id,
-                    entity_type=entity_type.value,
-                    name=entity_name,
+            if self.graph.has_node(memory_id):
+                self._role_index.get(self.graph.nodes[memory_id].get("source_role"), set()).discard(memory_id)
+            memory_nodes.append((memory_id, {"node_type": "memory", **node_attrs.to_dict()}))
+            self._role_index.setdefault(source_role, set()).add(memory_id)
+
+            # Extract and link entities
+            entities = self.extract_entities(mem["content"])
+
+            # Also add project as entity if specified
+            if project:
+                entities.append((EntityType.PROJECT, project))
+
+            for entity_type, entity_name in entities:
+                entity_id = self._make_entity_id(entity_type, entity_name)
+
+                # Add entity node if not exists
+                if entity_id not in entity_nodes and not self.graph.has_node(entity_id):
+                    entity_attrs = EntityNode(
+                        id=entity_id,
+                        entity_type=entity_type.value,
+                        name=entity_name,
+                    )
+                    entity_nodes[entity_id] = {"node_type": "entity", **entity_attrs.to_dict()}
+
+                # Add 'mentions' edge with attributes
+                edge_attrs = EdgeAttributes(
+                    edge_type=RelationType.MENTIONS.value,
+                    strength=0.5,  # Weak implicit relationship
+                    created_by="auto",
                 )
-                self.graph.add_node(entity_id, node_type="entity", **entity_attrs.to_dict())
+                edges.append((memory_id, entity_id, edge_attrs.to_dict()))
 
-            # Add 'mentions' edge with attributes
-            edge_attrs = EdgeAttributes(
-                edge_type=RelationType.MENTIONS.value,
-                strength=0.5,  # Weak implicit relationship
-                created_by="auto",
-            )
-            self.graph.add_edge(memory_id, entity_id, **edge_attrs.to_dict())
+            extracted.append(entities)
+
+        self.graph.add_nodes_from(memory_nodes)
+        self.graph.add_nodes_from(entity_nodes.items())
+        self.graph.add_edges_from(edges)
 
-        self.save()
-        return entities
+        self._persist()
+        return extracted
 
     def add_entity(
         self,
@@ -386,14 +475,22 @@ class KnowledgeGraph:
         )
 
         self.graph.add_node(entity_id, node_type="entity", **entity_attrs.to_dict())
-        self.save()
+        self._persist()
         return entity_id
 
+    def remove_memory(self, memory_id: str) -> bool:
+        """Remove a memory node and its edges. Returns False if it wasn't in the graph."""
+        if not self.graph.has_node(memory_id):
+            return False
+        self._role_index.get(self.graph.nodes[memory_id].get("source_role"), set()).discard(memory_id)
+        self.graph.remove_node(memory_id)
+        return True
+
     def update_memory_status(self, memory_id: str, status: MemoryStatus):
         """Update a memory's status."""
         if self.graph.has_node(memory_id):
             self.graph.nodes[memory_id]["status"] = status.value
-            self.save()
+            self._persist()
 
     def validate_memory(self, memory_id: str):
         """Record that a memory was validated as useful."""
@@ -406,7 +503,7 @@ class KnowledgeGraph:
             validations = node["validation_count"]
             node["confidence"] = min(0.95, 0.5 + (0.1 * validations))
 
-            self.save()
+            self._persist()
 
     # =========================================================================
     # RELATIONSHIP OPERATIONS
@@ -469,7 +566,7 @@ class KnowledgeGraph:
                 )
                 self.graph.add_edge(target_id, source_id, **reverse_attrs.to_dict())
 
-        self.save()
+        self._persist()
         return True
 
     def _get_reverse_relation(self, relation: RelationType) -> Optional[RelationType]:
@@ -606,6 +703,10 @@ class KnowledgeGraph:
             active.append(node_id)
         return active
 
+    def get_memories_by_role(self, source_role: Optional[str]) -> list[str]:
+        """Get all memories created by an agent role (None for role-less memories)."""
+        return list(self._role_index.get(source_role, ()))
+
     def get_superseded_by(self, memory_id: str) -> Optional[str]:
         """Find what memory superseded this one, if any."""
         for predecessor in self.graph.predecessors(memory_id):
@@ -8,6 +8,8 @@ from engram-mcp memories to improve response quality.
 
 import os
 import logging
+import hashlib
+from collections import OrderedDict
 from typing import Optional, Dict, Any, List
 
 # Setup structured logging
@@ -35,15 +37,20 @@ class PromptGenerator:
     - Claude-specific optimizations
     """
 
-    def __init__(self, memory_store=None):
+    def __init__(self, memory_store=None, cache_size: int = 256):
         """
         Initialize prompt generator.
 
         Args:
             memory_store: Optional engram-mcp MemoryStore for context
+            cache_size: Maximum number of generated prompts to cache (LRU)
         """
         self.memory_store = memory_store
 
+        # Generated prompt cache (LRU), keyed by inputs + context memories
+        self._cache_size = cache_size
+        self._cache: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+
     def generate_prompt(
         self,
         task: str,
@@ -75,9 +82,7 @@ class PromptGenerator:
         if not task or not task.strip():
             raise ValueError("Task cannot be empty")
 
-        if strategy not in ["concise", "detailed", "structured", "balanced"]:
-            logger.warning(f"Unknown strategy '{strategy}', using 'balanced'")
-            strategy = "balanced"
+        strategy, build = self._resolve_strategy(strategy)
 
         logger.debug(f"Generating prompt with strategy '{strategy}'", extra={
             "strategy": strategy,
@@ -86,31 +91,101 @@ class PromptGenerator:
             "limit_context": limit_context
         })
 
-        # Get relevant context from engram-mcp if available
-        context_memories = []
-        if self.memory_store and project:
-            try:
-                context_memories = self.memory_store.context(
-                    query=task,
-                    cwd=os.getcwd(),
-                    limit=limit_context
-                )
-                logger.debug(f"Retrieved {len(context_memories)} context memories", extra={
-                    "context_count": len(context_memories),
-                    "project": project
-                })
-            except Exception as e:
-                logger.warning(f"Failed to retrieve context memories: {e}", exc_info=True)
+        context_memories = self._fetch_context_memories(task, project, limit_context)
+
+        return self._render(task, context, strategy, build, project, limit_context, max_tokens, context_memories)
+
+    def generate_prompts(
+        self,
+        task: str,
+        strategies: List[str],
+        context: Optional[str] = None,
+        project: Optional[str] = None,
+        limit_context: int = 5,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate prompts for several strategies at once (e.g. for A/B comparison).
+
+        Context memories are retrieved once and shared by every strategy,
+        instead of once per generate_prompt() call.
+
+        Args:
+            task: What Claude needs to do
+            strategies: Strategies to build
+            context: Optional additional context
+            project: Optional project name for context retrieval
+            limit_context: Max number of memories to include
+            max_tokens: Optional maximum token limit for each prompt
+
+        Returns:
+            Dict mapping each requested strategy to its generate_prompt() result
+        """
+        if not task or not task.strip():
+            raise ValueError("Task cannot be empty")
+
+        context_memories = self._fetch_context_memories(task, project, limit_context)
+
+        results = {}
+        for requested in strategies:
+            strategy, build = self._resolve_strategy(requested)
+            results[requested] = self._render(
+                task, context, strategy, build, project, limit_context, max_tokens, context_memories
+            )
+        return results
+
+    def _resolve_strategy(self, strategy: str):
+        """Return (strategy, builder), falling back to balanced for unknown strategies."""
+        build = self._BUILDERS.get(strategy)
+        if build is None:
+            logger.warning(f"Unknown strategy '{strategy}', using 'balanced'")
+            strategy = "balanced"
+            build = self._BUILDERS[strategy]
+        return strategy, build
+
+    def _fetch_context_memories(self, task: str, project: Optional[str], limit_context: int) -> List[Dict]:
+        """Get relevant context from engram-mcp if available."""
+        if not (self.memory_store and project):
+            return []
+        try:
+            context_memories = self.memory_store.context(
+                query=task,
+                cwd=os.getcwd(),
+                limit=limit_context
+            )
+            logger.debug(f"Retrieved {len(context_memories)} context memories", extra={
+                "context_count": len(context_memories),
+                "project": project
+            })
+            return context_memories
+        except Exception as e:
+            logger.warning(f"Failed to retrieve context memories: {e}", exc_info=True)
+            return []
+
+    def _render(
+        self,
+        task: str,
+        context: Optional[str],
+        strategy: str,
+        build,
+        project: Optional[str],
+        limit_context: int,
+        max_tokens: Optional[int],
+        context_memories: List[Dict]
+    ) -> Dict[str, Any]:
+        """Build, truncate and optimize one prompt (served from the cache when possible)."""
+        cache_key = self._cache_key(task, context, strategy, project, limit_context, max_tokens, context_memories)
+        cached_result = self._cache.get(cache_key)
+        if cached_result is not None:
+            self._cache.move_to_end(cache_key)
+            logger.debug("Prompt cache hit", extra={"strategy": strategy, "project": project})
+            result = cached_result.copy()
+            result["context_memories"] = [dict(m) for m in cached_result["context_memories"]]
+            result["metadata"] = {**cached_result["metadata"], "cache_hit": True}
+            return result
 
         # Build prompt based on strategy
-        if strategy == "concise":
-            prompt = self._build_concise_prompt(task, context, context_memories)
-        elif strategy == "detailed":
-            prompt = self._build_detailed_prompt(task, context, context_memories)
-        elif strategy == "structured":
-            prompt = self._build_structured_prompt(task, context, context_memories)
-        else:  # balanced (default)
-            prompt = self._build_balanced_prompt(task, context, context_memories)
+        prompt = build(self, task, context, context_memories)
 
         # Validate prompt
         if not prompt or not prompt.strip():
@@ -141,7 +216,7 @@ class PromptGenerator:
             "context_memories_used": len(context_memories)
         })
 
-        return {
+        result = {
             "prompt": prompt,
             "strategy": strategy,
             "context_used": len(context_memories),
@@ -154,10 +229,41 @@ class PromptGenerator:
                 "has_context": len(context_memories) > 0,
                 "estimated_tokens": estimated_tokens,
                 "prompt_length": len(prompt),
-                "was_truncated": max_tokens is not None and estimated_tokens > max_tokens
+                "was_truncated": max_tokens is not None and estimated_tokens > max_tokens,
+                "cache_hit": False
             }
         }
 
+        # Cache a copy so callers can't mutate the cached entry
+        cached_result = result.copy()
+        cached_result["context_memories"] = [dict(m) for m in result["context_memories"]]
+        cached_result["metadata"] = dict(result["metadata"])
+        self._cache[cache_key] = cached_result
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+        return result
+
+    def _cache_key(
+        self,
+        task: str,
+        context: Optional[str],
+        strategy: str,
+        project: Optional[str],
+        limit_context: int,
+        max_tokens: Optional[int],
+        memories: List[Dict]
+    ) -> str:
+        """Generate cache key from the prompt inputs and the context memories used."""
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(f"{task}\0{context}\0{strategy}\0{project}\0{limit_context}\0{max_tokens}".encode())
+        # Memories are keyed by content too, so edited memories don't hit stale prompts
+        for mem in memories:
+            key_hash.update(
+                f"\0{mem.get('id')}\0{mem.get('memory_type')}\0{mem.get('content', '')}".encode()
+            )
+        return key_hash.hexdigest()
+
     def _build_concise_prompt(
         self,
         task: str,
@@ -171,8 +277,8 @@ class PromptGenerator:
             parts.append(f"\nContext: {context}")
 
         if memories:
-            relevant = "\n".join([f"- {m.get('content', '')[:100]}" for m in memories[:2]])
-            parts.append(f"\nRelevant information:\n{relevant}")
+            parts.append("\nRelevant information:")
+            parts.extend(f"- {m.get('content', '')[:100]}" for m in memories[:2])
 
         return "\n".join(parts)
 
@@ -219,12 +325,18 @@ class PromptGenerator:
             ])
 
         if memories:
-            parts.append("# Relevant Information")
+            # Group by type in one pass (dicts keep first-seen order). One
+            # header per type also keeps _optimize_prompt's duplicate-line
+            # removal from dropping a repeated header and leaving its
+            # content under the previous type's heading.
+            grouped: Dict[str, List[str]] = {}
             for mem in memories:
-                mem_type = mem.get("memory_type", "fact")
-                content = mem.get("content", "")
+                grouped.setdefault(mem.get("memory_type", "fact"), []).append(mem.get("content", ""))
+
+            parts.append("# Relevant Information")
+            for mem_type, contents in grouped.items():
                 parts.append(f"## {mem_type.title()}")
-                parts.append(content)
+                parts.extend(contents)
                 parts.append("")
 
         parts.append("# Instructions")
@@ -245,19 +357,23 @@ class PromptGenerator:
             parts.append(f"\nContext: {context}")
 
         if memories:
-            # Include top 3 most relevant memories
-            relevant = []
-            for mem in memories[:3]:
-                mem_type = mem.get("memory_type", "fact")
-                content = mem.get("content", "")[:150]
-                relevant.append(f"[{mem_type}] {content}")
-
-            if relevant:
-                parts.append("\nRelevant information:")
-                parts.append("\n".join(f"- {r}" for r in relevant))
+            # Include top 3 most relevant memories, formatted straight into parts
+            parts.append("\nRelevant information:")
+            parts.extend(
+                f"- [{mem.get('memory_type', 'fact')}] {mem.get('content', '')[:150]}"
+                for mem in memories[:3]
+            )
 
         return "\n".join(parts)
 
+    # Strategy -> builder, looked up once per call instead of an if/elif chain
+    _BUILDERS = {
+        "concise": _build_concise_prompt,
+        "detailed": _build_detailed_prompt,
+        "structured": _build_structured_prompt,
+        "balanced": _build_balanced_prompt,
+    }
+
     def _estimate_tokens(self, text: str) -> int:
         """
         Estimate token count for text.
@@ -294,18 +410,19 @@ class PromptGenerator:
         if len(text) <= max_chars:
             return text
 
-        # Truncate at word boundary
-        truncated = text[:max_chars]
-        last_space = truncated.rfind(" ")
-        last_newline = truncated.rfind("\n")
+        # Truncate at word boundary. Only boundaries in the last 20% of the
+        # budget are used, so search just that window of the original text
+        # instead of copying and scanning the whole prefix.
+        window_start = int(max_chars * 0.8) + 1
 
         # Prefer newline boundary, then space boundary
-        if last_newline > max_chars * 0.8:  # If newline is reasonably close
-            truncated = truncated[:last_newline]
-        elif last_space > max_chars * 0.8:  # If space is reasonably close
-            truncated = truncated[:last_space]
+        cut = text.rfind("\n", window_start, max_chars)
+        if cut == -1:
+            cut = text.rfind(" ", window_start, max_chars)
+        if cut == -1:
+            cut = max_chars
 
-        return truncated + "\n[... truncated ...]"
+        return text[:cut] + "\n[... truncated ...]"
 
     def _optimize_prompt(self, prompt: str) -> str:
         """
@@ -318,16 +435,18 @@ class PromptGenerator:
         if not prompt:
             return prompt
 
-        lines = prompt.split("\n")
         seen_lines = set()
         optimized_lines = []
+        # Whether the last kept line was blank (starts True to drop leading blanks)
+        prev_blank = True
 
-        for line in lines:
+        for line in prompt.split("\n"):
             stripped = line.strip()
             # Skip empty lines if previous line was also empty
             if not stripped:
-                if optimized_lines and optimized_lines[-1].strip():
+                if not prev_blank:
                     optimized_lines.append("")
+                    prev_blank = True
                 continue
 
             # Skip duplicate lines (case-insensitive)
@@ -335,9 +454,10 @@ class PromptGenerator:
             if line_lower not in seen_lines:
                 seen_lines.add(line_lower)
                 optimized_lines.append(line)
+                prev_blank = False
 
-        # Remove trailing empty lines
-        while optimized_lines and not optimized_lines[-1].strip():
+        # Remove trailing empty line (runs are already collapsed to one)
+        if prev_blank and optimized_lines:
             optimized_lines.pop()
 
         return "\n".join(optimized_lines)
@@ -11,6 +11,7 @@ This file sets up three "buttons" Claude can press:
 
 import os
 import json
+import time
 import asyncio
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
@@ -34,10 +35,41 @@ def get_store() -> MemoryStore:
     return _store
 
 
+# Prompt generator (lazy) - kept across calls so its prompt cache is reused
+_prompt_generator = None
+
+
+def get_prompt_generator():
+    """Get the prompt generator, creating it if needed."""
+    global _prompt_generator
+    if _prompt_generator is None:
+        from engram.prompt_generator import PromptGenerator
+        _prompt_generator = PromptGenerator(memory_store=get_store())
+    return _prompt_generator
+
+
 # File-based context (MCP server can't access parent process env vars)
 CONTEXT_STATE_DIR = os.path.expanduser("~/.spc/projects/state")
 
 
+# (file stamps, result) from the last _get_context_from_files() read
+_context_files_cache: tuple[tuple, tuple[str, str, str]] | None = None
+
+# A file rewritten with the same size within one mtime tick (up to 2s on
+# coarse filesystems) keeps its (mtime_ns, size) stamp, so results are only
+# cached once every state file is at least this old.
+_RACY_STAMP_NS = 2_000_000_000
+
+
+def _file_stamp(path: str) -> tuple[int, int] | None:
+    """(mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def _get_context_from_files() -> tuple[str, str, str]:
     """Read role, project, and agent_id from state files.
 
@@ -51,14 +83,35 @@ def _get_context_from_files() -> tuple[str, str, str]:
     agent_id: Stable identifier for this Claude Code tab/session.
               Used for context isolation (per-agent history tracking).
               Format: role + session_id if available, or role-based hash.
+
+    Called on every tool call, so the result is cached until one of the
+    state files changes (checked with one stat per file). Files modified
+    within the last _RACY_STAMP_NS are re-read on every call, since a
+    same-size rewrite inside one mtime tick would leave the stamp unchanged.
     """
+    global _context_files_cache
+
+    role_file = os.path.join(CONTEXT_STATE_DIR, "current_role")
+    project_file = os.path.normpath(
+        os.path.join(CONTEXT_STATE_DIR, "..", "..", "active_project")
+    )  # ~/.spc/active_project
+    session_id_file = os.path.join(CONTEXT_STATE_DIR, "session_id")
+
+    stamps = (
+        CONTEXT_STATE_DIR,
+        _file_stamp(role_file),
+        _file_stamp(project_file),
+        _file_stamp(session_id_file),
+    )
+    if _context_files_cache is not None and _context_files_cache[0] == stamps:
+        return _context_files_cache[1]
+
     role = ""
     project = ""
     agent_id = ""
 
     # Read role from file (written by claude-tab-integration.sh)
-    role_file = os.path.join(CONTEXT_STATE_DIR, "current_role")
-    if os.path.exists(role_file):
+    if stamps[1] is not None:
         try:
             with open(role_file) as f:
                 role = f.read().strip()
@@ -66,9 +119,7 @@ def _get_context_from_files() -> tuple[str, str, str]:
             pass
 
     # Read project from active_project JSON (written by proj command)
-    project_file = os.path.join(CONTEXT_STATE_DIR, "..", "..", "active_project")
-    project_file = os.path.normpath(project_file)  # ~/.spc/active_project
-    if os.path.exists(project_file):
+    if stamps[2] is not None:
         try:
             import json
             with open(project_file) as f:
@@ -79,9 +130,8 @@ def _get_context_from_files() -> tuple[str, str, str]:
 
     # Read or generate agent_id for context isolation
     # Try to read session_id from state file (if tab-init script writes it)
-    session_id_file = os.path.join(CONTEXT_STATE_DIR, "session_id")
     session_id = ""
-    if os.path.exists(session_id_file):
+    if stamps[3] is not None:
         try:
             with open(session_id_file) as f:
                 session_id = f.read().strip()
@@ -100,6 +150,11 @@ def _get_context_from_files() -> tuple[str, str, str]:
         agent_id = session_id
     # If neither role nor session_id, agent_id remains empty (will use correlation_id as fallback)
 
+    now_ns = time.time_ns()
+    if all(stamp is None or now_ns - stamp[0] >= _RACY_STAMP_NS for stamp in stamps[1:]):
+        _context_files_cache = (stamps, (role, project, agent_id))
+    else:
+        _context_files_cache = None
     return role, project, agent_id
 
 
@@ -1410,7 +1465,6 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
     elif name == "chainmind_generate_prompt":
         # Generate optimized prompt for Claude
         try:
-            from engram.prompt_generator import PromptGenerator
             import logging
 
             logger = logging.getLogger("engram.server.chainmind")
@@ -1467,7 +1521,7 @@ async def call_tool(name: str, arguments: dict) -> list[TextContent]:
                     text=f"Error: limit_context must be between 1 and 20, got {limit_context}"
                 )]
 
-            generator = PromptGenerator(memory_store=store)
+            generator = get_prompt_generator()
 
             # Prompt generation is synchronous
             result = generator.generate_prompt(
@@ -17,8 +17,11 @@ When you search for a memory:
 
 import sqlite3
 import uuid
+import functools
 import json
 import math
+import re
+from collections import OrderedDict
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -43,6 +46,80 @@ except ImportError:
     MemoryStatus = None
 
 
+# How many distinct query embeddings each store keeps around
+QUERY_EMBEDDING_CACHE_SIZE = 128
+
+# Relevance multiplier for memories created by the querying agent's role
+ROLE_AFFINITY_BOOST = 1.15
+
+# Rows of the similarity matrix computed at a time when looking for
+# consolidation clusters (bounds memory to block_size x memory count)
+CONSOLIDATION_BLOCK_SIZE = 256
+
+# Keys remember_many() accepts per memory (no conflict checks or superseding)
+REMEMBER_MANY_KEYS = frozenset({
+    "content", "memory_type", "importance", "project", "source_role", "metadata",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _load_embedder(model_name: str):
+    """Load a sentence-transformers model once per process.
+
+    Every MemoryStore in the process (server, scripts, test fixtures)
+    shares the same instance instead of reloading the weights.
+    """
+    from sentence_transformers import SentenceTransformer
+    return SentenceTransformer(model_name)
+
+
+# Keyword tokenizer for hybrid search.
+# ASCII queries (the common case) go through str.translate + split, which is a
+# pair of C loops. Non-ASCII text and underscores (which are word characters to
+# the regex, so '\b' never fires next to them) fall back to the regex so the
+# output matches r'\b[a-zA-Z0-9]+\b' exactly.
+_TOKENIZE_TABLE = str.maketrans({chr(c): " " for c in range(128) if not chr(c).isalnum()})
+_TOKEN_RE = re.compile(r'\b[a-zA-Z0-9]+\b')
+
+
+def _tokenize(text: str) -> list[str]:
+    """Split lowercased text into alphanumeric ASCII words."""
+    text = text.lower()
+    if text.isascii() and "_" not in text:
+        return text.translate(_TOKENIZE_TABLE).split()
+    return _TOKEN_RE.findall(text)
+
+
+# Common words that carry no search signal
+_STOPWORDS = frozenset({
+    'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
+    'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
+    'would', 'could', 'should', 'may', 'might', 'must', 'shall',
+    'can', 'need', 'dare', 'ought', 'used', 'to', 'of', 'in',
+    'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into',
+    'through', 'during', 'before', 'after', 'above', 'below',
+    'between', 'under', 'again', 'further', 'then', 'once',
+    'here', 'there', 'when', 'where', 'why', 'how', 'all',
+    'each', 'few', 'more', 'most', 'other', 'some', 'such',
+    'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than',
+    'too', 'very', 'just', 'and', 'but', 'if', 'or', 'because',
+    'until', 'while', 'what', 'which', 'who', 'this', 'that',
+    'these', 'those', 'am', 'it', 'its', 'i', 'me', 'my', 'we',
+    'our', 'you', 'your', 'he', 'him', 'his', 'she', 'her',
+    'they', 'them', 'their', 'best', 'practices', 'tips', 'help'
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _extract_keywords(query: str) -> frozenset[str]:
+    """Extract significant search keywords from a query.
+
+    Cached because agents tend to repeat the same recall queries; the
+    frozenset return value is immutable so cached results can be shared.
+    """
+    return frozenset(w for w in _tokenize(query) if w not in _STOPWORDS and len(w) > 2)
+
+
 class MemoryStore:
     """The main memory storage system.
 
@@ -77,6 +154,10 @@ class MemoryStore:
         # This is lazy-loaded to speed up startup
         self._embedder = None
 
+        # Recently embedded queries (LRU) - recall() is often called
+        # repeatedly with the same query string
+        self._query_embedding_cache: OrderedDict[str, list[float]] = OrderedDict()
+
     def _init_sqlite(self):
         """Create the filing cabinet (database tables)."""
         db_path = self.data_dir / "memories.db"
@@ -177,12 +258,24 @@ class MemoryStore:
         Similar meanings = similar numbers.
         """
         if self._embedder is None:
-            from sentence_transformers import SentenceTransformer
             # all-mpnet-base-v2 provides better quality (768d vs 384d)
             # ~420MB download on first use, but significantly better semantic understanding
-            self._embedder = SentenceTransformer('all-mpnet-base-v2')
+            self._embedder = _load_embedder('all-mpnet-base-v2')
         return self._embedder
 
+    def _embed_query(self, query: str) -> list[float]:
+        """Embed a search query, reusing the result for repeated queries."""
+        embedding = self._query_embedding_cache.get(query)
+        if embedding is not None:
+            self._query_embedding_cache.move_to_end(query)
+            return embedding
+
+        embedding = self.embedder.encode(query).tolist()
+        self._query_embedding_cache[query] = embedding
+        if len(self._query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embedding_cache.popitem(last=False)
+        return embedding
+
     def check_contradictions(
         self,
         content: str,
@@ -405,6 +498,124 @@ class MemoryStore:
 
         return memory_id
 
+    def remember_many(self, memories: list[dict]) -> list[str]:
+        """Store several memories in one batch.
+
+        Same storage as calling remember() for each item, but with one
+        embedding pass, one SQLite transaction, one ChromaDB insert and
+        one knowledge graph update and save.
+        Batch inserts skip conflict detection: check_conflicts and
+        supersede are rejected here - use remember() for those.
+
+        Args:
+            memories: List of dicts with remember() keyword arguments
+                      (content, memory_type, importance, project,
+                      source_role, metadata)
+
+        Returns:
+            The IDs of the stored memories, in input order
+
+        Raises:
+            ValueError: If a memory has a key outside REMEMBER_MANY_KEYS
+                        (including check_conflicts and supersede)
+
+        Example:
+            ids = store.remember_many([
+                {"content": "Use pytest fixtures", "memory_type": "pattern"},
+                {"content": "Prefer SQLite for local state", "importance": 0.8},
+            ])
+        """
+        if not memories:
+            return []
+
+        for mem in memories:
+            unsupported = mem.keys() - REMEMBER_MANY_KEYS
+            if unsupported:
+                raise ValueError(
+                    f"remember_many() does not support: {', '.join(sorted(unsupported))} "
+                    "(use remember() for check_conflicts/supersede)"
+                )
+
+        items = [
+            {
+                "content": mem["content"],
+                "memory_type": mem.get("memory_type", "fact"),
+                "importance": mem.get("importance", 0.5),
+                "project": mem.get("project"),
+                "source_role": mem.get("source_role"),
+                "metadata": mem.get("metadata"),
+            }
+            for mem in memories
+        ]
+        memory_ids = [f"mem_{uuid.uuid4().hex[:12]}" for _ in items]
+        contents = [item["content"] for item in items]
+
+        # Convert all texts to numbers in a single forward pass
+        embeddings = self.embedder.encode(contents).tolist()
+
+        # Store in SQLite (the filing cabinet) - one transaction
+        self.db.executemany(
+            """
+            INSERT INTO memories (id, content, memory_type, project, source_role, importance, metadata)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            [
+                (
+                    memory_id,
+                    item["content"],
+                    item["memory_type"],
+                    item["project"],
+                    item["source_role"],
+                    item["importance"],
+                    json.dumps(item["metadata"]) if item["metadata"] else None,
+                )
+                for memory_id, item in zip(memory_ids, items)
+            ]
+        )
+        self.db.commit()
+
+        # Store in ChromaDB (the smart index) - one insert
+        self.collection.add(
+            ids=memory_ids,
+            embeddings=embeddings,
+            documents=contents,
+            metadatas=[
+                {
+                    "memory_type": item["memory_type"],
+                    "project": item["project"] or "",
+                    "source_role": item["source_role"] or "",
+                    "importance": item["importance"],
+                }
+                for item in items
+            ]
+        )
+
+        # Store in knowledge graph (entity relationships) - one bulk update
+        # and one save of the graph file for the whole batch
+        if self.graph:
+            with self.graph.deferred_save():
+                self.graph.add_memories([
+                    {
+                        "memory_id": memory_id,
+                        "content": item["content"],
+                        "memory_type": item["memory_type"],
+                        "project": item["project"],
+                        "source_role": item["source_role"],
+                        "status": "active",
+                        "confidence": item["importance"],
+                        "impact": (
+                            "high" if item["importance"] > 0.7
+                            else "medium" if item["importance"] > 0.4
+                            else "low"
+                        ),
+                    }
+                    for memory_id, item in zip(memory_ids, items)
+                ])
+                for memory_id, item in zip(memory_ids, items):
+                    self._auto_extract(memory_id, item["content"])
+
+        return memory_ids
+
     def _auto_extract(self, memory_id: str, content: str) -> None:
         """Auto-extract entities and relationships from memory content.
 
@@ -552,6 +763,7 @@ class MemoryStore:
         memory_types: Optional[list[str]] = None,
         current_role: Optional[str] = None,
         hybrid_search: bool = True,
+        source_role: Optional[str] = None,
     ) -> list[dict]:
         """Search for memories by meaning with hybrid semantic + keyword search.
 
@@ -563,6 +775,8 @@ class MemoryStore:
             current_role: The agent role doing the query (for role affinity boost)
                           Memories created by the same role get a relevance boost.
             hybrid_search: If True, boost results that contain query keywords (default: True)
+            source_role: Only return memories created by this agent role. Applied
+                         inside the ChromaDB query, so all `limit` slots go to that role.
 
         Returns:
             List of matching memories, sorted by relevance
@@ -571,69 +785,65 @@ class MemoryStore:
             results = store.recall("how to approach new projects", current_role="gpu-specialist")
         """
         # Extract keywords for hybrid search (simple approach: significant words)
-        query_keywords = []
-        if hybrid_search:
-            import re
-            # Extract words, filter stopwords, keep significant terms
-            stopwords = {'the', 'a', 'an', 'is', 'are', 'was', 'were', 'be', 'been',
-                        'being', 'have', 'has', 'had', 'do', 'does', 'did', 'will',
-                        'would', 'could', 'should', 'may', 'might', 'must', 'shall',
-                        'can', 'need', 'dare', 'ought', 'used', 'to', 'of', 'in',
-                        'for', 'on', 'with', 'at', 'by', 'from', 'as', 'into',
-                        'through', 'during', 'before', 'after', 'above', 'below',
-                        'between', 'under', 'again', 'further', 'then', 'once',
-                        'here', 'there', 'when', 'where', 'why', 'how', 'all',
-                        'each', 'few', 'more', 'most', 'other', 'some', 'such',
-                        'no', 'nor', 'not', 'only', 'own', 'same', 'so', 'than',
-                        'too', 'very', 'just', 'and', 'but', 'if', 'or', 'because',
-                        'until', 'while', 'what', 'which', 'who', 'this', 'that',
-                        'these', 'those', 'am', 'it', 'its', 'i', 'me', 'my', 'we',
-                        'our', 'you', 'your', 'he', 'him', 'his', 'she', 'her',
-                        'they', 'them', 'their', 'best', 'practices', 'tips', 'help'}
-            words = re.findall(r'\b[a-zA-Z0-9]+\b', query.lower())
-            query_keywords = [w for w in words if w not in stopwords and len(w) > 2]
-
-        # Convert query to numbers
-        query_embedding = self.embedder.encode(query).tolist()
-
-        # Build filters
-        where_filter = {}
+        query_keywords = _extract_keywords(query) if hybrid_search else frozenset()
+
+        # Convert query to numbers (cached for repeated queries)
+        query_embedding = self._embed_query(query)
+
+        # Build filters (ChromaDB needs $and to combine more than one)
+        conditions = []
         if project:
-            where_filter["project"] = project
+            conditions.append({"project": project})
         if memory_types and len(memory_types) == 1:
-            where_filter["memory_type"] = memory_types[0]
+            conditions.append({"memory_type": memory_types[0]})
+        if source_role:
+            conditions.append({"source_role": source_role})
+        where_filter = None
+        if len(conditions) == 1:
+            where_filter = conditions[0]
+        elif conditions:
+            where_filter = {"$and": conditions}
 
         # Search ChromaDB for similar meanings
         results = self.collection.query(
             query_embeddings=[query_embedding],
             n_results=limit * 2,  # Get extra to filter/re-rank
-            where=where_filter if where_filter else None,
+            where=where_filter,
         )
 
         if not results["ids"] or not results["ids"][0]:
             return []
 
-        # Get full details from SQLite
+        # Get full details from SQLite in one query. Role affinity is computed
+        # in the projection: same-role memories get the boost, and a NULL
+        # current_role never matches so it yields 1.0 for every row.
+        candidate_ids = results["ids"][0]
+        placeholders = ", ".join("?" * len(candidate_ids))
+        rows_by_id = {
+            row["id"]: row
+            for row in self.db.execute(
+                f"""
+                SELECT *, CASE WHEN source_role = ? THEN ? ELSE 1.0 END AS role_affinity
+                FROM memories WHERE id IN ({placeholders})
+                """,
+                (current_role or None, ROLE_AFFINITY_BOOST, *candidate_ids)
+            )
+        }
+
+        # Access stats, validations and access log rows are collected here
+        # and written with one statement each after scoring
+        now = datetime.now()
+        touched_ids = []
+        newly_validated = []
+        access_log_rows = []
+
         memories = []
-        for i, memory_id in enumerate(results["ids"][0]):
-            # Get from SQLite
-            row = self.db.execute(
-                "SELECT * FROM memories WHERE id = ?",
-                (memory_id,)
-            ).fetchone()
+        for i, memory_id in enumerate(candidate_ids):
+            row = rows_by_id.get(memory_id)
 
             if row:
                 # Update access stats and surface count for implicit validation
-                self.db.execute(
-                    """
-                    UPDATE memories
-                    SET accessed_at = ?,
-                        access_count = access_count + 1,
-                        surface_count = COALESCE(surface_count, 0) + 1
-                    WHERE id = ?
-                    """,
-                    (datetime.now().isoformat(), memory_id)
-                )
+                touched_ids.append(memory_id)
 
                 # Implicit validation: auto-validate memories surfaced 5+ times
                 # This creates a learning loop - frequently useful memories get validated
@@ -641,16 +851,7 @@ class MemoryStore:
                 current_surface += 1
                 validated = row["validated"] if "validated" in row.keys() else 0
                 if current_surface >= 5 and not validated:
-                    self.db.execute(
-                        "UPDATE memories SET validated = 1 WHERE id = ?",
-                        (memory_id,)
-                    )
-                    # Also validate in graph if available
-                    if self.graph:
-                        try:
-                            self.graph.validate_memory(memory_id)
-                        except Exception:
-                            pass
+                    newly_validated.append(memory_id)
 
                 # Calculate relevance score with temporal decay + reinforcement
                 distance = results["distances"][0][i] if results["distances"] else 0
@@ -658,10 +859,10 @@ class MemoryStore:
 
                 # Temporal decay: memories lose relevance over time
                 # Half-life of ~30 days (memories lose 50% relevance per month if not accessed)
-                created = datetime.fromisoformat(row["created_at"]) if row["created_at"] else datetime.now()
+                created = datetime.fromisoformat(row["created_at"]) if row["created_at"] else now
                 accessed = datetime.fromisoformat(row["accessed_at"]) if row["accessed_at"] else created
                 last_touch = max(created, accessed)
-                days_since_touch = (datetime.now() - last_touch).days
+                days_since_touch = (now - last_touch).days
                 decay_factor = math.exp(-0.023 * days_since_touch)  # ~30 day half-life
 
                 # Reinforcement: frequently accessed memories are boosted
@@ -671,12 +872,8 @@ class MemoryStore:
 
                 # Role affinity: memories from the same agent role get a boost
                 # This allows agents to build expertise without siloing knowledge
-                source_role = row["source_role"] if "source_role" in row.keys() else None
-                role_affinity = 1.0
-                if current_role and source_role:
-                    if current_role == source_role:
-                        role_affinity = 1.15  # 15% boost for same-role memories
-                    # Could add partial matches here for related roles
+                source_role = row["source_role"]
+                role_affinity = row["role_affinity"]
 
                 # Keyword match boost (hybrid search)
                 # Memories containing query keywords get a relevance boost
@@ -724,17 +921,45 @@ class MemoryStore:
                 }
                 memories.append(memory_data)
 
-                # Log access for feedback loop (non-blocking)
-                try:
-                    self.log_access(
-                        memory_id=row["id"],
-                        query=query,
-                        role=current_role,
-                        project=project or row["project"],
-                        relevance=round(composite, 3),
-                    )
-                except Exception:
-                    pass  # Don't fail recall on logging error
+                # Log access for feedback loop
+                access_log_rows.append(
+                    (row["id"], query, current_role, project or row["project"], round(composite, 3))
+                )
+
+        if touched_ids:
+            self.db.executemany(
+                """
+                UPDATE memories
+                SET accessed_at = ?,
+                    access_count = access_count + 1,
+                    surface_count = COALESCE(surface_count, 0) + 1
+                WHERE id = ?
+                """,
+                [(now.isoformat(), memory_id) for memory_id in touched_ids]
+            )
+        if newly_validated:
+            self.db.executemany(
+                "UPDATE memories SET validated = 1 WHERE id = ?",
+                [(memory_id,) for memory_id in newly_validated]
+            )
+            # Also validate in graph if available
+            if self.graph:
+                for memory_id in newly_validated:
+                    try:
+                        self.graph.validate_memory(memory_id)
+                    except Exception:
+                        pass
+        if access_log_rows:
+            try:
+                self.db.executemany(
+                    """
+                    INSERT INTO access_log (memory_id, query, role, project, relevance)
+                    VALUES (?, ?, ?, ?, ?)
+                    """,
+                    access_log_rows
+                )
+            except Exception:
+                pass  # Don't fail recall on logging error
 
         self.db.commit()
 
@@ -747,6 +972,32 @@ class MemoryStore:
 
         return memories[:limit]
 
+    def recall_many(self, queries: list[str], **kwargs) -> list[list[dict]]:
+        """Run recall() for several queries with one embedding pass.
+
+        Queries not already in the query embedding cache are encoded
+        together, then each query is recalled as usual.
+
+        Args:
+            queries: Search queries (natural language)
+            **kwargs: Any other recall() arguments, applied to every query
+
+        Returns:
+            One result list per query, in input order
+        """
+        missing = [
+            query for query in dict.fromkeys(queries)
+            if query not in self._query_embedding_cache
+        ]
+        if missing:
+            embeddings = self.embedder.encode(missing).tolist()
+            for query, embedding in zip(missing, embeddings):
+                self._query_embedding_cache[query] = embedding
+            while len(self._query_embedding_cache) > QUERY_EMBEDDING_CACHE_SIZE:
+                self._query_embedding_cache.popitem(last=False)
+
+        return [self.recall(query, **kwargs) for query in queries]
+
     def context(
         self,
         query: Optional[str] = None,
@@ -954,64 +1205,68 @@ class MemoryStore:
         # (More sophisticated: DBSCAN or HDBSCAN, but this works for small sets)
         import numpy as np
 
-        embeddings_array = np.array(embeddings)
+        # Normalize once so a dot product is the cosine similarity, then
+        # compute the similarity matrix a block of rows at a time instead of
+        # materializing all N x N scores
+        embed_matrix = np.asarray(embeddings, dtype=np.float32)
+        norms = np.linalg.norm(embed_matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embed_matrix /= norms
+
         used = set()
         clusters = []
 
-        for i, embed_i in enumerate(embeddings_array):
-            if ids[i] in used:
-                continue
-
-            # Find all similar memories
-            cluster_ids = [ids[i]]
-            cluster_docs = [documents[i]]
+        for start in range(0, len(ids), CONSOLIDATION_BLOCK_SIZE):
+            block = embed_matrix[start:start + CONSOLIDATION_BLOCK_SIZE] @ embed_matrix.T
 
-            for j, embed_j in enumerate(embeddings_array):
-                if i == j or ids[j] in used:
+            for offset, similarities in enumerate(block):
+                i = start + offset
+                if ids[i] in used:
                     continue
 
-                # Cosine similarity
-                similarity = np.dot(embed_i, embed_j) / (
-                    np.linalg.norm(embed_i) * np.linalg.norm(embed_j)
-                )
+                # Find all similar memories
+                cluster_ids = [ids[i]]
+                cluster_docs = [documents[i]]
 
-                if similarity >= similarity_threshold:
+                for j in np.flatnonzero(similarities >= similarity_threshold):
+                    if i == j or ids[j] in used:
+                        continue
                     cluster_ids.append(ids[j])
                     cluster_docs.append(documents[j])
 
-            if len(cluster_ids) >= min_cluster_size:
-                # Mark all as used
-                used.update(cluster_ids)
-
-                # Get full memory details
-                memories = []
-                for mem_id in cluster_ids:
-                    row = self.db.execute(
-                        "SELECT * FROM memories WHERE id = ?", (mem_id,)
-                    ).fetchone()
-                    if row:
-                        memories.append({
-                            "id": row["id"],
-                            "content": row["content"],
-                            "memory_type": row["memory_type"],
-                            "project": row["project"],
-                            "importance": row["importance"],
-                        })
-
-                # Extract common theme (simple: use most common words)
-                all_text = " ".join(cluster_docs).lower()
-                words = [w for w in all_text.split() if len(w) > 4]
-                word_counts = {}
-                for w in words:
-                    word_counts[w] = word_counts.get(w, 0) + 1
-                top_words = sorted(word_counts.items(), key=lambda x: -x[1])[:5]
-                topic = ", ".join(w[0] for w in top_words)
-
-                clusters.append({
-                    "topic": topic,
-                    "count": len(memories),
-                    "memories": memories,
-                })
+                if len(cluster_ids) >= min_cluster_size:
+                    # Mark all as used
+                    used.update(cluster_ids)
+
+                    # Get full memory details
+                    memories = []
+                    for mem_id in cluster_ids:
+                        row = self.db.execute(
+                            "SELECT * FROM memories WHERE id = ?", (mem_id,)
+                        ).fetchone()
+                        if row:
+                            memories.append({
+                                "id": row["id"],
+                                "content": row["content"],
+                                "memory_type": row["memory_type"],
+                                "project": row["project"],
+                                "importance": row["importance"],
+                            })
+
+                    # Extract common theme (simple: use most common words)
+                    all_text = " ".join(cluster_docs).lower()
+                    words = [w for w in all_text.split() if len(w) > 4]
+                    word_counts = {}
+                    for w in words:
+                        word_counts[w] = word_counts.get(w, 0) + 1
+                    top_words = sorted(word_counts.items(), key=lambda x: -x[1])[:5]
+                    topic = ", ".join(w[0] for w in top_words)
+
+                    clusters.append({
+                        "topic": topic,
+                        "count": len(memories),
+                        "memories": memories,
+                    })
 
         # Sort by cluster size (highest impact first)
         clusters.sort(key=lambda c: -c["count"])
@@ -1308,34 +1563,67 @@ class MemoryStore:
         Returns:
             True if deleted successfully
         """
+        return self.delete_many([memory_id]) == 1
+
+    def delete_many(self, memory_ids: list[str]) -> int:
+        """Delete several memories completely (SQLite + ChromaDB + graph).
+
+        Same as calling delete_memory() for each ID, but with one SQLite
+        transaction and one ChromaDB delete. Unknown IDs are ignored.
+
+        Args:
+            memory_ids: The memory IDs to delete
+
+        Returns:
+            Number of memories deleted
+        """
+        if not memory_ids:
+            return 0
+
         try:
+            placeholders = ", ".join("?" * len(memory_ids))
+            existing = [
+                row["id"]
+                for row in self.db.execute(
+                    f"SELECT id FROM memories WHERE id IN ({placeholders})",
+                    memory_ids
+                )
+            ]
+            if not existing:
+                return 0
+
             # Delete from SQLite
-            cursor = self.db.execute(
-                "DELETE FROM memories WHERE id = ?",
-                (memory_id,)
+            self.db.execute(
+                f"DELETE FROM memories WHERE id IN ({', '.join('?' * len(existing))})",
+                existing
             )
-            deleted = cursor.rowcount > 0
 
-            if deleted:
-                # Delete from ChromaDB
-                try:
-                    self.collection.delete(ids=[memory_id])
-                except Exception:
-                    pass  # May not be in ChromaDB (archived)
+            # Delete from ChromaDB
+            try:
+                self.collection.delete(ids=existing)
+            except Exception:
+                pass  # May not be in ChromaDB (archived)
 
-                # Delete from graph if exists
-                if self.graph:
+            # Delete from graph if exists
+            if self.graph:
+                removed = False
+                for memory_id in existing:
                     try:
-                        self.graph.remove_node(memory_id)
+                        removed = self.graph.remove_memory(memory_id) or removed
+                    except Exception:
+                        pass
+                # One save for the whole batch; remove_memory doesn't persist
+                if removed:
+                    try:
+                        self.graph.save()
                     except Exception:
                         pass
 
-                self.db.commit()
-
-            return deleted
+            self.db.commit()
+            return len(existing)
 
         except Exception:
-            return False
+            return 0
 
     def update_memory(
         self,
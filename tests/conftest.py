@@ -5,6 +5,7 @@ These fixtures are REAL memories from Engram's development.
 They serve as both test data AND marketing examples.
 """
 
+import asyncio
 import pytest
 from pathlib import Path
 import tempfile
@@ -90,6 +91,54 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_chainmind)
 
 
+class _FakeRouter:
+    """Minimal async router returning a fixed response.
+
+    Used by throughput/latency tests instead of AsyncMock, whose call
+    bookkeeping adds noticeable overhead per request.
+    """
+
+    def __init__(self, resp):
+        self._resp = resp
+        self.call_count = 0
+
+    async def route(self, *args, **kwargs):
+        self.call_count += 1
+        return self._resp
+
+
+@pytest.fixture
+def fast_router():
+    """Lightweight router stub that always answers from anthropic."""
+    return _FakeRouter(resp={"response": "response", "provider": "anthropic", "metadata": {}})
+
+
+class _FakeClock:
+    """Deterministic clock for latency tests.
+
+    sleep() advances the clock instead of waiting, so simulated provider
+    latency costs no wall time.
+    """
+
+    def __init__(self):
+        self.now_ns = 0
+
+    def monotonic_ns(self):
+        return self.now_ns
+
+    async def sleep(self, seconds):
+        self.now_ns += int(seconds * 1e9)
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def fake_clock(monkeypatch):
+    """Drive ChainMindHelper latency measurement from a fake clock."""
+    clock = _FakeClock()
+    monkeypatch.setattr("engram.chainmind_helper._now_ns", clock.monotonic_ns)
+    return clock
+
+
 @pytest.fixture
 def temp_data_dir():
     """Create a temporary directory for test data."""
@@ -102,6 +151,7 @@ def temp_data_dir():
 @pytest.fixture
 def memory_store(temp_data_dir):
     """Fresh memory store for each test."""
+    pytest.importorskip("chromadb")
     from engram.storage import MemoryStore
     return MemoryStore(data_dir=temp_data_dir)
 
@@ -13,10 +13,9 @@ These tests ensure Phase 2 autonomous operation works correctly.
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+pytest.importorskip("chromadb")
+
 from engram.storage import MemoryStore
 
 
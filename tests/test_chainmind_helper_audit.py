@@ -13,13 +13,9 @@ Tests cover:
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-import sys
 import os
 from typing import Dict, Any
 
-# Add engram-mcp to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 
 class TestErrorDetectionAudit:
     """Test error detection improvements with ProviderErrorClassifier."""
@@ -55,6 +51,18 @@ class TestErrorDetectionAudit:
 
         assert category == "quota_exceeded"
 
+    def test_error_text_normalized_once(self):
+        """Test the lowercased error message is reused across checks."""
+        from engram.chainmind_helper import ChainMindHelper
+
+        helper = ChainMindHelper()
+        helper._error_classifier = None
+
+        error = Exception("Usage Limit reached")
+        assert helper._is_usage_limit_error(error) == True
+        assert error._engram_error_text == "usage limit reached"
+        assert helper._classify_error(error, "anthropic") == "quota_exceeded"
+
     def test_is_usage_limit_error_with_category(self):
         """Test usage limit detection using error category."""
         from engram.chainmind_helper import ChainMindHelper
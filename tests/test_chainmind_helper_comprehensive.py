@@ -14,11 +14,6 @@ Tests cover:
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-import sys
-import os
-
-# Add engram-mcp to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 class TestChainMindHelperInitialization:
@@ -5,11 +5,6 @@ Integration tests for ChainMind helper tools in engram-mcp.
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
-import sys
-import os
-
-# Add engram-mcp to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 class TestChainMindHelper:
@@ -11,13 +11,8 @@ Tests cover:
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
-import sys
-import os
 import time
 
-# Add engram-mcp to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 
 class TestCompleteWorkflows:
     """Test complete end-to-end workflows."""
@@ -14,13 +14,12 @@ These tests ensure the system is robust under unusual conditions.
 """
 
 import pytest
-import sys
 import threading
 import time
-from pathlib import Path
 from datetime import datetime, timedelta
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+pytest.importorskip("chromadb")
+
 from engram.storage import MemoryStore
 
 
@@ -373,6 +372,38 @@ class TestDatabaseIntegrity:
         chroma_results = store.collection.get(ids=[mem_id])
         assert mem_id not in chroma_results["ids"]
 
+    def test_delete_many_removes_from_both(self, store):
+        """delete_many should remove every known ID and ignore unknown ones."""
+        mem_ids = store.remember_many([
+            {"content": f"Bulk delete test {i}", "memory_type": "fact"}
+            for i in range(3)
+        ])
+
+        deleted = store.delete_many(mem_ids + ["mem_nonexistent_xyz123"])
+
+        assert deleted == 3
+        placeholders = ", ".join("?" * len(mem_ids))
+        assert store.db.execute(
+            f"SELECT COUNT(*) FROM memories WHERE id IN ({placeholders})",
+            mem_ids
+        ).fetchone()[0] == 0
+        assert store.collection.get(ids=mem_ids)["ids"] == []
+        assert store.delete_many([]) == 0
+
+    def test_remember_many_rejects_unsupported_keys(self, store):
+        """remember_many should refuse per-item options it would otherwise ignore."""
+        count_before = store.db.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
+
+        for bad_key, value in [("check_conflicts", True), ("supersede", ["mem_x"]), ("memroy_type", "fact")]:
+            with pytest.raises(ValueError, match=bad_key):
+                store.remember_many([
+                    {"content": "Valid batch item", "memory_type": "fact"},
+                    {"content": "Batch item with bad key", bad_key: value},
+                ])
+
+        # Nothing from a rejected batch is stored
+        assert store.db.execute("SELECT COUNT(*) FROM memories").fetchone()[0] == count_before
+
     def test_memory_id_uniqueness(self, store):
         """All memory IDs should be unique."""
         ids = []
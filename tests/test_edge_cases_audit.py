@@ -12,11 +12,6 @@ Tests cover:
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
-import sys
-import os
-
-# Add engram-mcp to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 
 class TestEmptyPromptEdgeCases:
@@ -205,6 +200,23 @@ class TestCircuitBreakerEdgeCases:
         # Should still be healthy (recent_failures reset)
         assert helper._check_provider_health("anthropic") == True
 
+    def test_circuit_breaker_sliding_window(self):
+        """Test flapping provider trips breaker via sliding-window failure rate."""
+        from engram.chainmind_helper import ChainMindHelper, HEALTH_WINDOW
+
+        helper = ChainMindHelper()
+
+        # Alternate fail, fail, succeed: never 3 consecutive failures
+        for _ in range(HEALTH_WINDOW):
+            helper._update_provider_health("anthropic", False)
+            helper._update_provider_health("anthropic", False)
+            helper._update_provider_health("anthropic", True)
+        helper._update_provider_health("anthropic", False)
+
+        health = helper._provider_health["anthropic"]
+        assert health["window_failures"] == sum(health["window"])
+        assert helper._check_provider_health("anthropic") == False
+
 
 class TestConfigurationEdgeCases:
     """Test configuration edge cases."""
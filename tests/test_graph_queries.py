@@ -14,10 +14,9 @@ These tests ensure the graph-based MCP tools work correctly.
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+pytest.importorskip("chromadb")
+
 from engram.storage import MemoryStore
 
 
@@ -505,3 +504,64 @@ class TestGetCurrentMemory:
 
         if current:
             assert current["id"] == mem_id
+
+
+class TestMemoriesByRole:
+    """Tests for the source_role index on memory nodes."""
+
+    def test_finds_memories_by_role(self, store):
+        """Should return exactly the memories created by a role."""
+        if not store.graph:
+            pytest.skip("Graph not available")
+
+        gpu_id = store.remember("GPU index test memory", memory_type="fact", source_role="gpu-index-test")
+        other_id = store.remember("Other index test memory", memory_type="fact", source_role="other-index-test")
+
+        gpu_memories = store.graph.get_memories_by_role("gpu-index-test")
+        assert gpu_id in gpu_memories
+        assert other_id not in gpu_memories
+
+    def test_deleted_memory_leaves_index_and_graph(self, store):
+        """delete_memory should drop the node from the graph and the role index."""
+        if not store.graph:
+            pytest.skip("Graph not available")
+
+        mem_id = store.remember("Deleted index test memory", memory_type="fact", source_role="delete-index-test")
+
+        assert store.delete_memory(mem_id)
+        assert mem_id not in store.graph.get_memories_by_role("delete-index-test")
+        assert not store.graph.graph.has_node(mem_id)
+
+    def test_deleted_memory_stays_deleted_after_reload(self, store):
+        """delete_memory should persist the graph so a reload doesn't bring the node back."""
+        if not store.graph:
+            pytest.skip("Graph not available")
+        from engram.graph import KnowledgeGraph
+
+        mem_id = store.remember("Reloaded delete test memory", memory_type="fact", source_role="reload-delete-test")
+        assert store.delete_memory(mem_id)
+
+        reloaded = KnowledgeGraph(store.graph.data_dir)
+        assert not reloaded.graph.has_node(mem_id)
+        assert mem_id not in reloaded.get_memories_by_role("reload-delete-test")
+
+    def test_remember_many_saves_graph_once(self, store):
+        """remember_many should write the graph file once for the whole batch."""
+        if not store.graph:
+            pytest.skip("Graph not available")
+        from unittest.mock import patch
+        from engram.graph import KnowledgeGraph
+
+        with patch.object(KnowledgeGraph, "save", autospec=True, side_effect=KnowledgeGraph.save) as save:
+            mem_ids = store.remember_many([
+                {
+                    "content": f"Goal: batch save test {i}. Uses Python",
+                    "memory_type": "fact",
+                    "source_role": "batch-save-test",
+                }
+                for i in range(5)
+            ])
+
+        assert save.call_count == 1
+        reloaded = KnowledgeGraph(store.graph.data_dir)
+        assert sorted(reloaded.get_memories_by_role("batch-save-test")) == sorted(mem_ids)
@@ -13,10 +13,9 @@ These tests ensure hybrid search improves result relevance.
 """
 
 import pytest
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+pytest.importorskip("chromadb")
+
 from engram.storage import MemoryStore
 
 
@@ -80,6 +79,32 @@ class TestKeywordExtraction:
         # Longer words kept
         assert "api" in keywords  # 3 chars
 
+    def test_tokenizer_matches_regex(self):
+        """Fast ASCII tokenizer should split exactly like the regex."""
+        import re
+        from engram.storage import _tokenize
+
+        queries = [
+            "C++ programming!@#$ basics??",
+            "Python 3.11 features",
+            "snake_case and kebab-case\ttabs\nnewlines",
+            "café naïve résumé",  # Non-ASCII takes the regex fallback
+            "",
+        ]
+        for query in queries:
+            assert _tokenize(query) == re.findall(r'\b[a-zA-Z0-9]+\b', query.lower())
+
+    def test_keyword_extraction_is_cached(self):
+        """Repeated queries should reuse the cached keyword set."""
+        from engram.storage import _extract_keywords
+
+        first = _extract_keywords("How to optimize Python code for performance")
+        second = _extract_keywords("How to optimize Python code for performance")
+
+        assert first == {"optimize", "python", "code", "performance"}
+        assert isinstance(first, frozenset)
+        assert first is second
+
     def test_handles_empty_query(self, store):
         """Empty query should not crash."""
         results = store.recall("", limit=5)
@@ -225,6 +250,30 @@ class TestHybridVsPureSemantic:
             top_content = results_hybrid[0]["content"].lower()
             assert "cuda" in top_content or "memory" in top_content
 
+    def test_query_embedding_shared_across_modes(self, store):
+        """Hybrid and semantic recall of the same query should embed it once."""
+        store.remember("CUDA out of memory error fix solution", memory_type="solution")
+
+        store.recall("CUDA out of memory fix", limit=5, hybrid_search=True)
+        cached = store._query_embedding_cache["CUDA out of memory fix"]
+        store.recall("CUDA out of memory fix", limit=5, hybrid_search=False)
+
+        assert store._query_embedding_cache["CUDA out of memory fix"] is cached
+
+    def test_recall_many_matches_recall(self, store):
+        """recall_many should batch-embed queries and return per-query results."""
+        store.remember("CUDA out of memory error fix solution", memory_type="solution")
+        store.remember("Python packaging with uv", memory_type="pattern")
+        queries = ["CUDA memory error", "uv packaging", "CUDA memory error"]
+
+        batched = store.recall_many(queries, limit=5)
+
+        assert len(batched) == len(queries)
+        assert all(q in store._query_embedding_cache for q in queries)
+        single = store.recall("uv packaging", limit=5)
+        assert batched[1] and single
+        assert batched[1][0]["id"] == single[0]["id"]
+
     def test_hybrid_doesnt_break_semantic(self, store):
         """Hybrid search shouldn't hurt semantic-only matches."""
         store.remember("Machine learning model training optimization", memory_type="pattern")
@@ -306,9 +355,11 @@ class TestHybridSearchPerformance:
         """Hybrid search shouldn't be much slower than semantic-only."""
         import time
 
-        # Create some memories
-        for i in range(10):
-            store.remember(f"Test memory {i} with various content", memory_type="fact")
+        # Create some memories (one batched embedding pass)
+        store.remember_many([
+            {"content": f"Test memory {i} with various content", "memory_type": "fact"}
+            for i in range(10)
+        ])
 
         # Time hybrid search
         start = time.time()
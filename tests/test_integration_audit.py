@@ -10,13 +10,10 @@ Tests cover:
 
 import pytest
 import asyncio
+import time
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
-import sys
 import os
 
-# Add engram-mcp to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 
 class TestFullRequestFlow:
     """Test complete request flow with all improvements."""
@@ -90,6 +87,42 @@ class TestFullRequestFlow:
         assert result["usage_limit_hit"] == True
         assert helper._metrics["fallback_requests"] == 1
 
+    @pytest.mark.asyncio
+    async def test_fallback_does_not_wait_for_slower_providers(self):
+        """Test first-priority fallback success cancels the remaining attempts."""
+        from engram.chainmind_helper import ChainMindHelper
+
+        helper = ChainMindHelper()
+
+        quota_error = Exception("quota exceeded")
+        quota_error.code = "CM-1801"
+        cancelled = []
+
+        async def route(prompt, provider=None, **kwargs):
+            if provider == "anthropic":
+                raise quota_error
+            if provider == "ollama":
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled.append(provider)
+                    raise
+            return {"response": f"{provider} response", "provider": provider, "metadata": {}}
+
+        mock_router = AsyncMock()
+        mock_router.route = AsyncMock(side_effect=route)
+
+        helper._router = mock_router
+        helper._initialized = True
+
+        start = time.perf_counter()
+        result = await asyncio.wait_for(helper.generate("test prompt", prefer_claude=True), timeout=2)
+
+        assert result["provider"] == "openai"
+        assert time.perf_counter() - start < 1
+        await asyncio.sleep(0)
+        assert cancelled == ["ollama"]
+
     @pytest.mark.asyncio
     async def test_all_fallbacks_fail(self):
         """Test error aggregation when all fallbacks fail."""
@@ -253,16 +286,16 @@ class TestMetricsIntegration:
         helper._router = mock_router
         helper._initialized = True
 
-        initial_metrics = helper.get_metrics()
-        initial_total = initial_metrics["total_requests"]
+        before = helper.metrics_snapshot()
 
         await helper.generate("test prompt")
 
-        updated_metrics = helper.get_metrics()
+        delta = helper.metrics_delta(before)
 
-        assert updated_metrics["total_requests"] == initial_total + 1
-        assert updated_metrics["successful_requests"] > initial_metrics.get("successful_requests", 0)
-        assert updated_metrics["provider_usage"]["anthropic"] > 0
+        assert delta["total_requests"] == 1
+        assert delta["successful_requests"] == 1
+        assert delta["provider_usage"] == {"anthropic": 1}
+        assert helper.get_metrics()["provider_usage"]["anthropic"] > 0
 
 
 if __name__ == "__main__":
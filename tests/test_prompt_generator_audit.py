@@ -9,51 +9,38 @@ Tests cover:
 """
 
 import pytest
-import sys
-import os
 
-# Add engram-mcp to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engram.prompt_generator import PromptGenerator
+
+
+@pytest.fixture
+def generator():
+    """Fresh prompt generator without a memory store."""
+    return PromptGenerator()
 
 
 class TestPromptValidationAudit:
     """Test prompt validation improvements."""
 
-    def test_empty_task_validation(self):
+    def test_empty_task_validation(self, generator):
         """Test that empty tasks are rejected."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         with pytest.raises(ValueError, match="cannot be empty"):
             generator.generate_prompt("")
 
-    def test_whitespace_only_task_validation(self):
+    def test_whitespace_only_task_validation(self, generator):
         """Test that whitespace-only tasks are rejected."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         with pytest.raises(ValueError, match="cannot be empty"):
             generator.generate_prompt("   \n\t  ")
 
-    def test_invalid_strategy_validation(self):
+    def test_invalid_strategy_validation(self, generator):
         """Test that invalid strategies are handled."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         # Invalid strategy should default to balanced
         result = generator.generate_prompt("test task", strategy="invalid_strategy")
 
         assert result["strategy"] == "balanced"
 
-    def test_valid_strategies(self):
+    def test_valid_strategies(self, generator):
         """Test that all valid strategies work."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         strategies = ["concise", "detailed", "structured", "balanced"]
 
         for strategy in strategies:
@@ -65,12 +52,8 @@ class TestPromptValidationAudit:
 class TestTokenEstimationAudit:
     """Test token estimation functionality."""
 
-    def test_token_estimation_basic(self):
+    def test_token_estimation_basic(self, generator):
         """Test basic token estimation."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         # Rough estimate: 4 chars per token
         text = "test " * 20  # 100 chars, ~25 tokens
         tokens = generator._estimate_tokens(text)
@@ -78,21 +61,13 @@ class TestTokenEstimationAudit:
         assert tokens >= 20  # Should be roughly 25
         assert tokens <= 30  # With some variance
 
-    def test_token_estimation_empty(self):
+    def test_token_estimation_empty(self, generator):
         """Test token estimation for empty text."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         assert generator._estimate_tokens("") == 0
         assert generator._estimate_tokens(None) == 0
 
-    def test_token_estimation_with_markdown(self):
+    def test_token_estimation_with_markdown(self, generator):
         """Test token estimation accounts for markdown overhead."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         text_with_markdown = "# Header\n\n```code```\n\nContent"
         text_without_markdown = "Header code Content"
 
@@ -106,12 +81,8 @@ class TestTokenEstimationAudit:
 class TestPromptTruncationAudit:
     """Test prompt truncation functionality."""
 
-    def test_truncate_to_tokens(self):
+    def test_truncate_to_tokens(self, generator):
         """Test truncation to token limit."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         # Create long text
         text = "word " * 1000  # ~5000 chars, ~1250 tokens
 
@@ -124,12 +95,8 @@ class TestPromptTruncationAudit:
         # Should have truncation marker
         assert "[... truncated ...]" in truncated
 
-    def test_truncate_at_word_boundary(self):
+    def test_truncate_at_word_boundary(self, generator):
         """Test that truncation happens at word boundaries."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         text = "word1 word2 word3 word4 word5"
 
         # Truncate to small size
@@ -138,12 +105,8 @@ class TestPromptTruncationAudit:
         # Should end at word boundary or have truncation marker
         assert truncated.endswith("...]") or truncated[-1].isalnum()
 
-    def test_no_truncation_when_under_limit(self):
+    def test_no_truncation_when_under_limit(self, generator):
         """Test that text under limit is not truncated."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         text = "short text"
         truncated = generator._truncate_to_tokens(text, 1000)
 
@@ -154,12 +117,8 @@ class TestPromptTruncationAudit:
 class TestPromptOptimizationAudit:
     """Test prompt optimization functionality."""
 
-    def test_remove_duplicate_lines(self):
+    def test_remove_duplicate_lines(self, generator):
         """Test removal of duplicate lines."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         prompt = "line1\nline2\nline1\nline3\nline2"
         optimized = generator._optimize_prompt(prompt)
 
@@ -170,36 +129,24 @@ class TestPromptOptimizationAudit:
         lines = optimized.split("\n")
         assert len(set(lines)) == len([l for l in lines if l.strip()])
 
-    def test_remove_excessive_whitespace(self):
+    def test_remove_excessive_whitespace(self, generator):
         """Test removal of excessive whitespace."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         prompt = "line1\n\n\n\nline2\n\nline3"
         optimized = generator._optimize_prompt(prompt)
 
         # Should have fewer consecutive empty lines
         assert "\n\n\n\n" not in optimized
 
-    def test_remove_trailing_empty_lines(self):
+    def test_remove_trailing_empty_lines(self, generator):
         """Test removal of trailing empty lines."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         prompt = "line1\nline2\n\n\n\n"
         optimized = generator._optimize_prompt(prompt)
 
         # Should not end with empty lines
         assert not optimized.endswith("\n\n")
 
-    def test_preserve_structure(self):
+    def test_preserve_structure(self, generator):
         """Test that optimization preserves important structure."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         prompt = "# Header\n\nContent here\n\n## Subheader\n\nMore content"
         optimized = generator._optimize_prompt(prompt)
 
@@ -211,12 +158,8 @@ class TestPromptOptimizationAudit:
 class TestPromptGenerationWithLimits:
     """Test prompt generation with token limits."""
 
-    def test_generate_with_max_tokens(self):
+    def test_generate_with_max_tokens(self, generator):
         """Test prompt generation respects max_tokens."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         # Generate with very small limit
         result = generator.generate_prompt(
             "test task",
@@ -230,12 +173,8 @@ class TestPromptGenerationWithLimits:
         if result["metadata"].get("was_truncated"):
             assert result["metadata"]["was_truncated"] == True
 
-    def test_generate_without_max_tokens(self):
+    def test_generate_without_max_tokens(self, generator):
         """Test prompt generation without limits."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
-
         result = generator.generate_prompt("test task")
 
         assert result["prompt"]
@@ -243,5 +182,67 @@ class TestPromptGenerationWithLimits:
         assert result["metadata"].get("was_truncated") == False
 
 
+class TestPromptCacheAudit:
+    """Test generated prompt caching."""
+
+    def test_repeated_prompt_is_cached(self):
+        """Test identical inputs are served from the cache."""
+        from unittest.mock import Mock
+        mock_store = Mock()
+        mock_store.context.return_value = [
+            {"id": "m1", "memory_type": "fact", "content": "Uses SQLite"}
+        ]
+        generator = PromptGenerator(memory_store=mock_store)
+
+        first = generator.generate_prompt("test task", strategy="concise", project="engram")
+        second = generator.generate_prompt("test task", strategy="concise", project="engram")
+
+        assert first["metadata"]["cache_hit"] == False
+        assert second["metadata"]["cache_hit"] == True
+        assert second["prompt"] == first["prompt"]
+
+        # Mutating a returned result must not leak into the cache
+        first["context_memories"].clear()
+        second["metadata"]["project"] = "changed"
+        second["context_memories"].append({"type": "fact", "content": "extra"})
+        second["context_memories"][0]["content"] = "changed"
+        third = generator.generate_prompt("test task", strategy="concise", project="engram")
+        assert third["metadata"]["project"] == "engram"
+        assert third["context_memories"] == [{"type": "fact", "content": "Uses SQLite"}]
+
+        # Different inputs miss
+        other = generator.generate_prompt("test task", strategy="detailed")
+        assert other["metadata"]["cache_hit"] == False
+
+    def test_cache_keyed_by_context_memories(self):
+        """Test changed context memories produce a fresh prompt."""
+        from unittest.mock import Mock
+        mock_store = Mock()
+        mock_store.context.return_value = [
+            {"id": "m1", "memory_type": "fact", "content": "Uses SQLite"}
+        ]
+        generator = PromptGenerator(memory_store=mock_store)
+
+        first = generator.generate_prompt("test task", project="engram")
+        assert "Uses SQLite" in first["prompt"]
+
+        mock_store.context.return_value = [
+            {"id": "m1", "memory_type": "fact", "content": "Uses Postgres"}
+        ]
+        second = generator.generate_prompt("test task", project="engram")
+
+        assert second["metadata"]["cache_hit"] == False
+        assert "Uses Postgres" in second["prompt"]
+
+    def test_cache_size_limit(self):
+        """Test the prompt cache evicts least recently used entries."""
+        generator = PromptGenerator(cache_size=2)
+
+        for i in range(5):
+            generator.generate_prompt(f"task {i}")
+
+        assert len(generator._cache) == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
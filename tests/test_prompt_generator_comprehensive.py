@@ -11,28 +11,39 @@ Tests cover:
 
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
-import sys
-import os
 
-# Add engram-mcp to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from engram.prompt_generator import PromptGenerator
+
+
+@pytest.fixture
+def generator():
+    """Fresh prompt generator without a memory store."""
+    return PromptGenerator()
+
+
+@pytest.fixture
+def mock_store_factory():
+    """Build mock stores whose context() returns n numbered memories."""
+    def _make(n=3, types=("fact", "preference", "decision")):
+        store = Mock()
+        store.context.return_value = [
+            {"content": f"Memory {i}", "memory_type": types[(i - 1) % len(types)]}
+            for i in range(1, n + 1)
+        ]
+        return store
+    return _make
 
 
 class TestPromptGeneratorInitialization:
     """Test prompt generator initialization."""
 
-    def test_generator_initialization_default(self):
+    def test_generator_initialization_default(self, generator):
         """Test generator initialization without memory store."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         assert generator is not None
         assert generator.memory_store is None
 
     def test_generator_initialization_with_store(self):
         """Test generator initialization with memory store."""
-        from engram.prompt_generator import PromptGenerator
-
         mock_store = Mock()
         generator = PromptGenerator(memory_store=mock_store)
         assert generator.memory_store == mock_store
@@ -41,11 +52,8 @@ class TestPromptGeneratorInitialization:
 class TestPromptStrategies:
     """Test all prompt generation strategies."""
 
-    def test_concise_strategy(self):
+    def test_concise_strategy(self, generator):
         """Test concise prompt strategy."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             strategy="concise"
@@ -56,11 +64,8 @@ class TestPromptStrategies:
         assert "Write a function" in result["prompt"]
         assert len(result["prompt"]) < 500  # Should be concise
 
-    def test_detailed_strategy(self):
+    def test_detailed_strategy(self, generator):
         """Test detailed prompt strategy."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             strategy="detailed"
@@ -71,11 +76,8 @@ class TestPromptStrategies:
         assert "Task:" in result["prompt"]
         assert "comprehensive response" in result["prompt"].lower()
 
-    def test_structured_strategy(self):
+    def test_structured_strategy(self, generator):
         """Test structured prompt strategy."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             strategy="structured"
@@ -86,11 +88,8 @@ class TestPromptStrategies:
         assert "# Task" in result["prompt"]
         assert "# Instructions" in result["prompt"]
 
-    def test_balanced_strategy(self):
+    def test_balanced_strategy(self, generator):
         """Test balanced prompt strategy (default)."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             strategy="balanced"
@@ -100,20 +99,14 @@ class TestPromptStrategies:
         assert result["strategy"] == "balanced"
         assert "Write a function" in result["prompt"]
 
-    def test_default_strategy(self):
+    def test_default_strategy(self, generator):
         """Test default strategy (should be balanced)."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(task="Write a function")
 
         assert result["strategy"] == "balanced"
 
-    def test_invalid_strategy_fallback(self):
+    def test_invalid_strategy_fallback(self, generator):
         """Test fallback to balanced for invalid strategy."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             strategy="invalid_strategy"
@@ -126,11 +119,8 @@ class TestPromptStrategies:
 class TestContextIntegration:
     """Test context integration in prompts."""
 
-    def test_prompt_with_context(self):
+    def test_prompt_with_context(self, generator):
         """Test prompt generation with additional context."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             context="Use TypeScript",
@@ -139,11 +129,8 @@ class TestContextIntegration:
 
         assert "Context: Use TypeScript" in result["prompt"]
 
-    def test_concise_with_context(self):
+    def test_concise_with_context(self, generator):
         """Test concise strategy with context."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             context="Use TypeScript",
@@ -152,11 +139,8 @@ class TestContextIntegration:
 
         assert "Context: Use TypeScript" in result["prompt"]
 
-    def test_detailed_with_context(self):
+    def test_detailed_with_context(self, generator):
         """Test detailed strategy with context."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             context="Use TypeScript",
@@ -166,11 +150,8 @@ class TestContextIntegration:
         assert "Additional Context:" in result["prompt"]
         assert "Use TypeScript" in result["prompt"]
 
-    def test_structured_with_context(self):
+    def test_structured_with_context(self, generator):
         """Test structured strategy with context."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             context="Use TypeScript",
@@ -186,8 +167,6 @@ class TestMemoryStoreIntegration:
 
     def test_prompt_with_memory_store(self):
         """Test prompt generation with memory store."""
-        from engram.prompt_generator import PromptGenerator
-
         mock_store = Mock()
         mock_store.context.return_value = [
             {"content": "User prefers TypeScript", "memory_type": "preference"},
@@ -207,8 +186,6 @@ class TestMemoryStoreIntegration:
 
     def test_prompt_with_memory_store_no_project(self):
         """Test prompt generation without project (should not call store)."""
-        from engram.prompt_generator import PromptGenerator
-
         mock_store = Mock()
         generator = PromptGenerator(memory_store=mock_store)
         result = generator.generate_prompt(
@@ -222,8 +199,6 @@ class TestMemoryStoreIntegration:
 
     def test_prompt_with_memory_store_error(self):
         """Test graceful handling when memory store fails."""
-        from engram.prompt_generator import PromptGenerator
-
         mock_store = Mock()
         mock_store.context.side_effect = Exception("Store error")
 
@@ -238,15 +213,9 @@ class TestMemoryStoreIntegration:
         assert "prompt" in result
         assert result["context_used"] == 0
 
-    def test_prompt_with_limit_context(self):
+    def test_prompt_with_limit_context(self, mock_store_factory):
         """Test limiting context memories."""
-        from engram.prompt_generator import PromptGenerator
-
-        mock_store = Mock()
-        mock_store.context.return_value = [
-            {"content": f"Memory {i}", "memory_type": "fact"}
-            for i in range(10)
-        ]
+        mock_store = mock_store_factory(n=10)
 
         generator = PromptGenerator(memory_store=mock_store)
         result = generator.generate_prompt(
@@ -261,15 +230,9 @@ class TestMemoryStoreIntegration:
         assert call_args[1]["limit"] == 3
         assert result["context_used"] == 10  # Store returns 10, but we use top 3
 
-    def test_concise_with_memories(self):
+    def test_concise_with_memories(self, mock_store_factory):
         """Test concise strategy with memories."""
-        from engram.prompt_generator import PromptGenerator
-
-        mock_store = Mock()
-        mock_store.context.return_value = [
-            {"content": "Memory 1", "memory_type": "fact"},
-            {"content": "Memory 2", "memory_type": "preference"}
-        ]
+        mock_store = mock_store_factory(n=2)
 
         generator = PromptGenerator(memory_store=mock_store)
         result = generator.generate_prompt(
@@ -281,15 +244,9 @@ class TestMemoryStoreIntegration:
         assert "Relevant information:" in result["prompt"]
         assert "Memory 1" in result["prompt"] or "Memory 2" in result["prompt"]
 
-    def test_detailed_with_memories(self):
+    def test_detailed_with_memories(self, mock_store_factory):
         """Test detailed strategy with memories."""
-        from engram.prompt_generator import PromptGenerator
-
-        mock_store = Mock()
-        mock_store.context.return_value = [
-            {"content": "Memory 1", "memory_type": "fact"},
-            {"content": "Memory 2", "memory_type": "preference"}
-        ]
+        mock_store = mock_store_factory(n=2)
 
         generator = PromptGenerator(memory_store=mock_store)
         result = generator.generate_prompt(
@@ -301,15 +258,9 @@ class TestMemoryStoreIntegration:
         assert "Relevant Memories:" in result["prompt"]
         assert "[fact]" in result["prompt"] or "[preference]" in result["prompt"]
 
-    def test_structured_with_memories(self):
+    def test_structured_with_memories(self, mock_store_factory):
         """Test structured strategy with memories."""
-        from engram.prompt_generator import PromptGenerator
-
-        mock_store = Mock()
-        mock_store.context.return_value = [
-            {"content": "Memory 1", "memory_type": "fact"},
-            {"content": "Memory 2", "memory_type": "preference"}
-        ]
+        mock_store = mock_store_factory(n=2)
 
         generator = PromptGenerator(memory_store=mock_store)
         result = generator.generate_prompt(
@@ -321,17 +272,30 @@ class TestMemoryStoreIntegration:
         assert "# Relevant Information" in result["prompt"]
         assert "## Fact" in result["prompt"] or "## Preference" in result["prompt"]
 
-    def test_balanced_with_memories(self):
-        """Test balanced strategy with memories."""
-        from engram.prompt_generator import PromptGenerator
-
+    def test_structured_groups_memories_by_type(self):
+        """Test structured strategy emits one section per memory type."""
         mock_store = Mock()
         mock_store.context.return_value = [
             {"content": "Memory 1", "memory_type": "fact"},
             {"content": "Memory 2", "memory_type": "preference"},
-            {"content": "Memory 3", "memory_type": "decision"}
+            {"content": "Memory 3", "memory_type": "fact"}
         ]
 
+        generator = PromptGenerator(memory_store=mock_store)
+        prompt = generator.generate_prompt(
+            task="Write a function",
+            project="test-project",
+            strategy="structured"
+        )["prompt"]
+
+        assert prompt.count("## Fact") == 1
+        # Memory 3 stays in the Fact section, before the Preference section
+        assert prompt.index("## Fact") < prompt.index("Memory 3") < prompt.index("## Preference")
+
+    def test_balanced_with_memories(self, mock_store_factory):
+        """Test balanced strategy with memories."""
+        mock_store = mock_store_factory(n=3)
+
         generator = PromptGenerator(memory_store=mock_store)
         result = generator.generate_prompt(
             task="Write a function",
@@ -344,25 +308,37 @@ class TestMemoryStoreIntegration:
         assert result["context_used"] == 3
 
 
+    def test_generate_prompts_fetches_context_once(self, mock_store_factory):
+        """Test multi-strategy generation shares one context lookup."""
+        mock_store = mock_store_factory(n=2)
+
+        generator = PromptGenerator(memory_store=mock_store)
+        results = generator.generate_prompts(
+            task="Write a function",
+            strategies=["concise", "structured", "invalid_strategy"],
+            project="test-project"
+        )
+
+        mock_store.context.assert_called_once()
+        assert list(results) == ["concise", "structured", "invalid_strategy"]
+        assert results["structured"]["strategy"] == "structured"
+        assert results["invalid_strategy"]["strategy"] == "balanced"
+        assert all(r["context_used"] == 2 for r in results.values())
+
+
 class TestPromptMetadata:
     """Test prompt generation metadata."""
 
-    def test_metadata_without_project(self):
+    def test_metadata_without_project(self, generator):
         """Test metadata without project."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(task="Write a function")
 
         assert "metadata" in result
         assert result["metadata"]["project"] is None
         assert result["metadata"]["has_context"] == False
 
-    def test_metadata_with_project(self):
+    def test_metadata_with_project(self, generator):
         """Test metadata with project."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         result = generator.generate_prompt(
             task="Write a function",
             project="test-project"
@@ -370,14 +346,9 @@ class TestPromptMetadata:
 
         assert result["metadata"]["project"] == "test-project"
 
-    def test_metadata_with_context(self):
+    def test_metadata_with_context(self, mock_store_factory):
         """Test metadata with context memories."""
-        from engram.prompt_generator import PromptGenerator
-
-        mock_store = Mock()
-        mock_store.context.return_value = [
-            {"content": "Memory 1", "memory_type": "fact"}
-        ]
+        mock_store = mock_store_factory(n=1)
 
         generator = PromptGenerator(memory_store=mock_store)
         result = generator.generate_prompt(
@@ -390,8 +361,6 @@ class TestPromptMetadata:
 
     def test_context_memories_preview(self):
         """Test context memories preview in result."""
-        from engram.prompt_generator import PromptGenerator
-
         mock_store = Mock()
         mock_store.context.return_value = [
             {"content": "This is a long memory that should be truncated in preview", "memory_type": "fact"},
@@ -415,30 +384,21 @@ class TestPromptMetadata:
 class TestEdgeCases:
     """Test edge cases and error handling."""
 
-    def test_empty_task(self):
+    def test_empty_task(self, generator):
         """Test prompt generation with empty task raises ValueError."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         with pytest.raises(ValueError, match="Task cannot be empty"):
             generator.generate_prompt(task="")
 
-    def test_very_long_task(self):
+    def test_very_long_task(self, generator):
         """Test prompt generation with very long task."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         long_task = "Write a function " * 100
         result = generator.generate_prompt(task=long_task)
 
         assert "prompt" in result
         assert long_task[:50] in result["prompt"]
 
-    def test_special_characters_in_task(self):
+    def test_special_characters_in_task(self, generator):
         """Test prompt generation with special characters."""
-        from engram.prompt_generator import PromptGenerator
-
-        generator = PromptGenerator()
         special_task = "Write a function with @#$%^&*() characters"
         result = generator.generate_prompt(task=special_task)
 
@@ -446,8 +406,6 @@ class TestEdgeCases:
 
     def test_memory_store_none(self):
         """Test prompt generation when memory_store is None."""
-        from engram.prompt_generator import PromptGenerator
-
         generator = PromptGenerator(memory_store=None)
         result = generator.generate_prompt(
             task="Write a function",
@@ -460,8 +418,6 @@ class TestEdgeCases:
 
     def test_memory_with_missing_fields(self):
         """Test handling memories with missing fields."""
-        from engram.prompt_generator import PromptGenerator
-
         mock_store = Mock()
         mock_store.context.return_value = [
             {"content": "Memory without type"},
@@ -8,11 +8,10 @@ test cases to measure precision, recall, and ranking quality.
 Run: pytest tests/test_search_quality.py -v
 """
 
-import sys
 import pytest
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent))
+pytest.importorskip("chromadb")
+
 from engram.storage import MemoryStore
 
 
@@ -168,18 +167,23 @@ def metrics():
     return SearchQualityMetrics()
 
 
-def check_content_contains(content: str, terms: list) -> tuple[list, list]:
-    """Check which terms are found in content."""
-    content_lower = content.lower()
-    found = []
-    missing = []
+def check_content_contains(results: list, terms: list) -> tuple[list, list]:
+    """Check which terms are found in the content of any result.
+
+    Scans result by result and stops as soon as every term is found.
+    """
+    remaining = {term: term.lower() for term in terms}
 
-    for term in terms:
-        if term.lower() in content_lower:
-            found.append(term)
-        else:
-            missing.append(term)
+    for result in results:
+        content_lower = result["content"].lower()
+        for term, term_lower in list(remaining.items()):
+            if term_lower in content_lower:
+                del remaining[term]
+        if not remaining:
+            break
 
+    found = [term for term in terms if term not in remaining]
+    missing = [term for term in terms if term in remaining]
     return found, missing
 
 
@@ -199,11 +203,8 @@ def test_search_quality(store, metrics, test_case):
         memory_types=memory_types,
     )
 
-    # Combine all result content
-    all_content = " ".join(r["content"] for r in results)
-
-    # Check for required terms
-    found_terms, missing_terms = check_content_contains(all_content, must_contain)
+    # Check for required terms across the results
+    found_terms, missing_terms = check_content_contains(results, must_contain)
 
     # Calculate metrics
     recall = len(found_terms) / len(must_contain) if must_contain else 1.0
@@ -253,9 +254,7 @@ if __name__ == "__main__":
         top_k = test_case.get("top_k", 5)
 
         results = store.recall(query=query, limit=top_k)
-        all_content = " ".join(r["content"] for r in results)
-
-        found, missing = check_content_contains(all_content, must_contain)
+        found, missing = check_content_contains(results, must_contain)
         recall = len(found) / len(must_contain) if must_contain else 1.0
 
         status = "✓" if recall >= 0.5 else "✗"
@@ -11,15 +11,26 @@ import sys
 import json
 import asyncio
 import logging
+import itertools
+from collections import deque
 from typing import Dict, Any
 from datetime import datetime
 
-# Setup detailed logging
+try:
+    import orjson  # Optional: much faster trace serialization
+except ImportError:
+    orjson = None
+
+# Setup logging (TRACE_LOG=DEBUG for ChainMind's detailed internal logs)
+_trace_log = os.environ.get("TRACE_LOG", "INFO").upper()
+_log_level = logging.getLevelName(_trace_log)  # int for known level names
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=_log_level if isinstance(_log_level, int) else logging.INFO,
     format='%(asctime)s [%(levelname)s] %(name)s: %(message)s',
     datefmt='%Y-%m-%d %H:%M:%S'
 )
+if not isinstance(_log_level, int):
+    logging.warning(f"Unknown TRACE_LOG level {_trace_log!r}, using INFO")
 
 # Add paths
 CHAINMIND_PATH = "/mnt/dev/ai/ai-platform/chainmind"
@@ -31,18 +42,58 @@ if ENGRAM_PATH not in sys.path:
     sys.path.insert(0, ENGRAM_PATH)
 
 # Import after path setup
-from engram.chainmind_helper import ChainMindHelper
+from engram.chainmind_helper import get_helper
+
+
+def _env_int(name: str, default: int) -> int:
+    """Integer environment variable, or default (with a warning) if it isn't one."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logging.warning(f"{name}={value!r} is not an integer, using {default}")
+        return default
+
+
+def _dumps(data: Any) -> bytes:
+    """Serialize trace data as indented JSON, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
+def _tail(items, n: int) -> list:
+    """Last n items of a list or deque without copying the whole sequence."""
+    try:
+        return list(itertools.islice(reversed(items), n))[::-1]
+    except TypeError:  # Not reversible - keep a bounded window while iterating
+        return list(deque(items, maxlen=n))
+
+
+# Stages recorded at trace level 1; level 2 (default) records every stage
+SUMMARY_STAGES = {"INITIAL_REQUEST", "EXECUTION", "SUMMARY"}
 
 
 class RequestTracer:
     """Traces request flow through the entire system."""
 
-    def __init__(self):
+    def __init__(self, verbose: bool = True, level: int = 2):
         self.trace_log = []
         self.step_counter = 0
+        self.verbose = verbose
+        self.level = level
+
+    def wants(self, stage: str) -> bool:
+        """Whether steps of this stage are recorded at the current trace level."""
+        return self.level >= 2 or stage in SUMMARY_STAGES
 
     def log_step(self, stage: str, step: str, data: Dict[str, Any], description: str = ""):
         """Log a step in the trace."""
+        if not self.wants(stage):
+            return
+
         self.step_counter += 1
         entry = {
             "step": self.step_counter,
@@ -54,6 +105,9 @@ class RequestTracer:
         }
         self.trace_log.append(entry)
 
+        if not self.verbose:
+            return
+
         # Print formatted output
         print(f"\n{'='*80}")
         print(f"STEP {self.step_counter}: {stage} - {step}")
@@ -61,7 +115,7 @@ class RequestTracer:
         if description:
             print(f"Description: {description}")
         print(f"\nData:")
-        print(json.dumps(entry["data"], indent=2, default=str))
+        print(_dumps(entry["data"]).decode())
         print(f"{'='*80}\n")
 
     def _sanitize_data(self, data: Any) -> Any:
@@ -83,8 +137,8 @@ class RequestTracer:
             filename = f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
         output_path = os.path.join(ENGRAM_PATH, filename)
-        with open(output_path, 'w') as f:
-            json.dump(self.trace_log, f, indent=2, default=str)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(self.trace_log))
 
         print(f"\n✓ Trace saved to: {output_path}")
         return output_path
@@ -93,7 +147,9 @@ class RequestTracer:
 async def trace_request_flow(prompt: str, agent_role: str = "software_engineer", agent_id: str = "test_session_123"):
     """Trace a request through the entire system."""
 
-    tracer = RequestTracer()
+    # Per-step output can be turned off; the saved trace is always complete
+    verbose = os.environ.get("TRACE_VERBOSE", "true").lower() == "true"
+    tracer = RequestTracer(verbose=verbose, level=_env_int("TRACE_LEVEL", 2))
 
     # ========================================================================
     # STAGE 1: Initial Request
@@ -118,7 +174,8 @@ async def trace_request_flow(prompt: str, agent_role: str = "software_engineer",
     # ========================================================================
     # STAGE 2: ChainMindHelper Entry
     # ========================================================================
-    helper = ChainMindHelper()
+    # Shared instance, so repeated traces reuse an initialized router
+    helper = get_helper()
 
     tracer.log_step(
         "CHAINMIND_HELPER",
@@ -204,77 +261,80 @@ async def trace_request_flow(prompt: str, agent_role: str = "software_engineer",
         if hasattr(strategic_router, 'input_analyzer'):
             input_analyzer = strategic_router.input_analyzer
 
-            # Trace InputAnalyzer.analyze()
-            tracer.log_step(
-                "INPUT_ANALYZER",
-                "Input Analysis Start",
-                {
-                    "prompt": prompt,
-                    "context": request_dict.get("context", {}),
-                    "agent_id": agent_id,
-                    "agent_role": agent_role
-                },
-                "InputAnalyzer.analyze() called with prompt and context"
-            )
+            # The step-by-step probes below only feed the trace
+            if tracer.wants("INPUT_ANALYZER"):
+                # Trace InputAnalyzer.analyze()
+                tracer.log_step(
+                    "INPUT_ANALYZER",
+                    "Input Analysis Start",
+                    {
+                        "prompt": prompt,
+                        "context": request_dict.get("context", {}),
+                        "agent_id": agent_id,
+                        "agent_role": agent_role
+                    },
+                    "InputAnalyzer.analyze() called with prompt and context"
+                )
 
-            # Analyze prompt structure
-            structure_info = input_analyzer._analyze_prompt_structure(prompt)
-            tracer.log_step(
-                "INPUT_ANALYZER",
-                "Prompt Structure Analysis",
-                structure_info,
-                "Structure analysis: code blocks, imports, file paths, etc."
-            )
+                # Analyze prompt structure
+                structure_info = input_analyzer._analyze_prompt_structure(prompt)
+                tracer.log_step(
+                    "INPUT_ANALYZER",
+                    "Prompt Structure Analysis",
+                    structure_info,
+                    "Structure analysis: code blocks, imports, file paths, etc."
+                )
 
-            # Detect domain
-            domain = input_analyzer._detect_domain(prompt.lower(), agent_role=agent_role)
-            tracer.log_step(
-                "INPUT_ANALYZER",
-                "Domain Detection",
-                {
-                    "detected_domain": domain,
-                    "agent_role": agent_role,
-                    "role_domain_mapping": agent_role in input_analyzer.role_domain_mapping,
-                    "mapped_domain": input_analyzer.role_domain_mapping.get(agent_role) if agent_role in input_analyzer.role_domain_mapping else None
-                },
-                "Domain detection with role-based boosting"
-            )
+                # Detect domain
+                domain = input_analyzer._detect_domain(prompt.lower(), agent_role=agent_role)
+                tracer.log_step(
+                    "INPUT_ANALYZER",
+                    "Domain Detection",
+                    {
+                        "detected_domain": domain,
+                        "agent_role": agent_role,
+                        "role_domain_mapping": agent_role in input_analyzer.role_domain_mapping,
+                        "mapped_domain": input_analyzer.role_domain_mapping.get(agent_role) if agent_role in input_analyzer.role_domain_mapping else None
+                    },
+                    "Domain detection with role-based boosting"
+                )
 
-            # Detect task type with confidence
-            task_type_result = input_analyzer._detect_task_type_with_confidence(
-                prompt.lower(),
-                structure_info,
-                agent_id=agent_id,
-                agent_role=agent_role
-            )
-            tracer.log_step(
-                "INPUT_ANALYZER",
-                "Task Type Detection",
-                task_type_result,
-                "Task type detection with confidence scoring and role boosting"
-            )
+                # Detect task type with confidence
+                task_type_result = input_analyzer._detect_task_type_with_confidence(
+                    prompt.lower(),
+                    structure_info,
+                    agent_id=agent_id,
+                    agent_role=agent_role
+                )
+                tracer.log_step(
+                    "INPUT_ANALYZER",
+                    "Task Type Detection",
+                    task_type_result,
+                    "Task type detection with confidence scoring and role boosting"
+                )
 
-            # Get context boost
-            context_boost = input_analyzer._get_context_boost(agent_id=agent_id)
-            agent_history = input_analyzer._get_agent_history(agent_id)
-            tracer.log_step(
-                "INPUT_ANALYZER",
-                "Context-Aware Boosting",
-                {
-                    "context_boost": context_boost,
-                    "agent_id": agent_id,
-                    "history_size": len(agent_history) if agent_history else 0,
-                    "history_entries": [
-                        {
-                            "task_type": entry.get("task_type"),
-                            "domain": entry.get("domain"),
-                            "age_seconds": round(datetime.now().timestamp() - entry.get("timestamp", 0), 2) if entry.get("timestamp") else None
-                        }
-                        for entry in list(agent_history)[-5:]  # Last 5 entries
-                    ] if agent_history else []
-                },
-                "Context-aware boosting from agent-specific history"
-            )
+                # Get context boost
+                context_boost = input_analyzer._get_context_boost(agent_id=agent_id)
+                agent_history = input_analyzer._get_agent_history(agent_id)
+                now_ts = datetime.now().timestamp()
+                tracer.log_step(
+                    "INPUT_ANALYZER",
+                    "Context-Aware Boosting",
+                    {
+                        "context_boost": context_boost,
+                        "agent_id": agent_id,
+                        "history_size": len(agent_history) if agent_history else 0,
+                        "history_entries": [
+                            {
+                                "task_type": entry.get("task_type"),
+                                "domain": entry.get("domain"),
+                                "age_seconds": round(now_ts - entry.get("timestamp", 0), 2) if entry.get("timestamp") else None
+                            }
+                            for entry in _tail(agent_history, 5)  # Last 5 entries
+                        ] if agent_history else []
+                    },
+                    "Context-aware boosting from agent-specific history"
+                )
 
             # Full analysis
             analysis_result = input_analyzer.analyze(prompt, context=request_dict.get("context", {}))